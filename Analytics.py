@@ -0,0 +1,82 @@
+from Cache import TTLCache
+
+# Rollups are computed inside MongoDB and kept for a short while, so chart
+# pages cost the same no matter how large the collections grow.
+_cache = TTLCache(ttl=60, max_items=64)
+
+SCORE_BUCKETS = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 101]
+
+def _cached(key, compute):
+    value = _cache.get(key)
+    if value is None:
+        value = compute()
+        _cache.set(key, value)
+    return value
+
+def invalidate(key=None):
+    if key is None:
+        _cache.clear()
+    else:
+        _cache.pop(key)
+
+def _counts(stage_field):
+    return [
+        {"$group": {"_id": stage_field, "count": {"$sum": 1}}},
+        {"$sort": {"count": -1}}
+    ]
+
+# ---------- Feedback ----------
+def feedback_score_counts(collection):
+    def compute():
+        pipeline = [
+            {"$group": {"_id": "$feed_score", "count": {"$sum": 1}}},
+            {"$sort": {"_id": 1}}
+        ]
+        return [{"score": d["_id"], "count": d["count"]} for d in collection.aggregate(pipeline)]
+    return _cached("feedback_scores", compute)
+
+# ---------- Talent Analytics ----------
+def user_overview(collection, top_skills=15, days=30):
+    def compute():
+        pipeline = [{"$facet": {
+            "by_field": _counts("$predicted_field"),
+            "by_level": _counts("$user_level"),
+            "score_histogram": [
+                {"$bucket": {"groupBy": "$resume_score", "boundaries": SCORE_BUCKETS,
+                             "default": "other", "output": {"count": {"$sum": 1}}}}
+            ],
+            "top_skills": [
+                {"$unwind": "$actual_skills"},
+                {"$group": {"_id": {"$toLower": "$actual_skills"}, "count": {"$sum": 1}}},
+                {"$sort": {"count": -1}},
+                {"$limit": top_skills}
+            ],
+            "by_country": [
+                {"$match": {"country": {"$nin": [None, "", "Unknown"]}}},
+                *_counts("$country"),
+                {"$limit": 20}
+            ],
+            "uploads_per_day": [
+                {"$group": {"_id": {"$substrBytes": ["$timestamp", 0, 10]}, "count": {"$sum": 1}}},
+                {"$sort": {"_id": -1}},
+                {"$limit": days},
+                {"$sort": {"_id": 1}}
+            ],
+            "totals": [
+                {"$group": {"_id": None, "count": {"$sum": 1}, "avg_score": {"$avg": "$resume_score"}}}
+            ]
+        }}]
+        facets = next(collection.aggregate(pipeline), {})
+        totals = (facets.get("totals") or [{}])[0]
+        rows = lambda name, label: [{label: d["_id"], "count": d["count"]} for d in facets.get(name, [])]
+        return {
+            "total": totals.get("count", 0),
+            "avg_score": totals.get("avg_score") or 0,
+            "by_field": rows("by_field", "field"),
+            "by_level": rows("by_level", "level"),
+            "score_histogram": rows("score_histogram", "score_from"),
+            "top_skills": rows("top_skills", "skill"),
+            "by_country": rows("by_country", "country"),
+            "uploads_per_day": rows("uploads_per_day", "day")
+        }
+    return _cached(("user_overview", top_skills, days), compute)
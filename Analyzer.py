@@ -0,0 +1,211 @@
+import os
+import re
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Optional
+from Cache import content_hash
+from Extractor import extract_pages
+from Sections import section_rubric
+from Skills import skill_matcher
+from Taxonomy import get_taxonomy
+
+# Heavy dependencies (pdfminer, spaCy) are imported on first use so this
+# module can be imported by workers, benchmarks and services without pulling
+# in Streamlit, MongoDB or the Gemini client.
+
+# ---------- Result ----------
+@dataclass
+class ResumeAnalysis:
+    resume_hash: str
+    resume_text: str
+    name: str
+    email: Optional[str]
+    mobile_number: Optional[str]
+    skills: List[str]
+    no_of_pages: int
+    cand_level: str
+    reco_field: str
+    field_scores: Dict[str, int]
+    recommended_skills: List[str]
+    resume_score: int
+    ai_pitch: Optional[str] = None
+    sections: Dict[str, int] = field(default_factory=dict)
+
+    def to_record(self):
+        return {
+            "resume_hash": self.resume_hash,
+            "candidate_name": self.name,
+            "candidate_email": self.email,
+            "resume_score": self.resume_score,
+            "total_pages": self.no_of_pages,
+            "predicted_field": self.reco_field,
+            "user_level": self.cand_level,
+            "actual_skills": self.skills,
+            "recommended_skills": self.recommended_skills,
+            "resume_text": self.resume_text,
+        }
+
+    def to_dict(self):
+        return asdict(self)
+
+# ---------- NLP Model ----------
+# Name extraction only needs NER, which in en_core_web_sm has its own
+# tok2vec, so the default model is loaded with everything else excluded.
+# The full pipeline is loaded separately, and only for features that
+# actually consume a parsed document.
+# SPACY_MODEL may point at a pre-baked model directory so nothing is fetched
+# at startup.
+NLP_MODEL = os.environ.get("SPACY_MODEL", "en_core_web_sm")
+NER_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+_models = {}
+_models_lock = threading.Lock()
+
+def get_nlp(full=False):
+    key = "full" if full else "ner"
+    with _models_lock:
+        if key not in _models:
+            import spacy
+            _models[key] = spacy.load(NLP_MODEL) if full else spacy.load(NLP_MODEL, exclude=NER_EXCLUDE)
+        return _models[key]
+
+def parse(resume_text):
+    return get_nlp(full=True)(resume_text)
+
+# ---------- Name, Email & Phone ----------
+NAME_BLACKLIST = {'Pandas', 'Numpy', 'Spacy', 'Java', 'React', 'Python', 'Resume', 'CV', 'Page'}
+
+def extract_name(nlp, resume_text, pdf_name):
+    lines = [line.strip() for line in resume_text.split('\n') if line.strip()]
+    extracted_name = None
+    for line_doc in nlp.pipe(lines[:3]):
+        for ent in line_doc.ents:
+            if ent.label_ == "PERSON" and ent.text.strip() not in NAME_BLACKLIST:
+                extracted_name = ent.text.strip()
+                break
+        if extracted_name: break
+    if not extracted_name:
+        fn = pdf_name.split('.')[0]
+        fn = re.sub(r'(?i)(resume|cv|final|updated|v\d+|20\d{2}|20\d{1})', '', fn)
+        fn = re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', fn)
+        fn = re.sub(r'(_|-|\.)', ' ', fn)
+        extracted_name = ' '.join(fn.split()).title()
+    if not extracted_name or len(extracted_name) < 2:
+        extracted_name = "Candidate"
+    return extracted_name
+
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+')
+PHONE_RE = re.compile(r'(\d{10}|\(\d{3}\)\s*\d{3}[-\.\s]??\d{4}|\d{3}[-\.\s]??\d{3}[-\.\s]??\d{4})')
+
+def extract_contact(resume_text):
+    email_match = EMAIL_RE.search(resume_text)
+    phone_match = PHONE_RE.search(resume_text)
+    email = email_match.group(0) if email_match else None
+    phone = phone_match.group(0) if phone_match else None
+    return email, phone
+
+# ---------- Level, Field & Score ----------
+def predict_level(resume_text, no_of_pages, sections=None):
+    if sections is None:
+        sections = section_rubric.detect(resume_text)
+    return section_rubric.level(sections, no_of_pages)
+
+FIELD_RECOMMENDED_SKILLS = {
+    "Data Science": ["Deep Learning", "Feature Engineering", "Model Deployment", "MLOps"],
+    "Web Development": ["System Design", "Advanced Backend Architecture", "Docker", "CI/CD"],
+    "Android Development": ["Jetpack Compose", "Firebase", "MVVM Architecture"],
+    "IOS Development": ["SwiftUI", "CoreData", "App Store Deployment"],
+    "UI-UX Development": ["Design Systems", "Interaction Design", "User Research"],
+}
+DEFAULT_RECOMMENDED_SKILLS = ["Problem Solving", "Communication"]
+
+def predict_field(field_scores, semantic=None):
+    if max(field_scores.values()) == 0:
+        reco_field = "General / Undetermined"
+    else:
+        reco_field = max(field_scores, key=field_scores.get)
+    recommended_skills = list(FIELD_RECOMMENDED_SKILLS.get(reco_field, DEFAULT_RECOMMENDED_SKILLS))
+    if semantic is not None and reco_field in FIELD_RECOMMENDED_SKILLS:
+        known = {s.lower() for s in recommended_skills}
+        for skill in get_taxonomy().recommend(reco_field, semantic["best"], semantic["skills"]):
+            if skill.lower() not in known:
+                recommended_skills.append(skill)
+    return reco_field, recommended_skills
+
+# Exact keyword hits plus taxonomy neighbours ("scikit learn", "machine
+# learnings"); a field scores the larger of the two counts.
+SEMANTIC_SKILLS = os.environ.get("SEMANTIC_SKILLS", "1") == "1"
+
+def match_skills(resume_text, semantic=SEMANTIC_SKILLS):
+    found_skills, field_scores = skill_matcher.match(resume_text)
+    if not semantic:
+        return found_skills, field_scores, None
+    result = get_taxonomy().score(resume_text)
+    seen = {s.lower() for s in found_skills}
+    found_skills = found_skills + [s for s in result["skills"] if s not in seen]
+    field_scores = {f: max(n, result["field_scores"].get(f, 0)) for f, n in field_scores.items()}
+    return found_skills, field_scores, dict(result, skills=found_skills)
+
+def score_resume(resume_text, sections=None):
+    if sections is None:
+        sections = section_rubric.detect(resume_text)
+    return section_rubric.score(sections)
+
+# ---------- Full Pipeline (no UI, no AI) ----------
+# `timer` is an optional Metrics.StageTimer; each stage is timed under it.
+def analyze_text(resume_text, pdf_name="resume.pdf", resume_hash="", nlp=None, no_of_pages=1, timer=None):
+    stage = timer.stage if timer else _no_stage
+    with stage("nlp"):
+        if nlp is None:
+            nlp = get_nlp()
+        name = extract_name(nlp, resume_text, pdf_name)
+    with stage("match"):
+        email, phone = extract_contact(resume_text)
+        found_skills, field_scores, semantic = match_skills(resume_text)
+    with stage("score"):
+        reco_field, recommended_skills = predict_field(field_scores, semantic)
+        sections = section_rubric.detect(resume_text)
+        cand_level = predict_level(resume_text, no_of_pages, sections)
+        resume_score = score_resume(resume_text, sections)
+    return ResumeAnalysis(
+        resume_hash=resume_hash,
+        resume_text=resume_text,
+        name=name,
+        email=email,
+        mobile_number=phone,
+        skills=found_skills,
+        no_of_pages=no_of_pages,
+        cand_level=cand_level,
+        reco_field=reco_field,
+        field_scores=field_scores,
+        recommended_skills=recommended_skills,
+        resume_score=resume_score,
+        sections=sections
+    )
+
+# Scanned pages are OCRed when pdf2image/pytesseract and tesseract are
+# installed; OCR_FALLBACK=0 turns this off.
+OCR_FALLBACK = os.environ.get("OCR_FALLBACK", "1") == "1"
+
+# With a Dedupe.DuplicateIndex, a near-duplicate of an earlier upload is
+# analyzed under the earlier resume_hash so the records are linked. The parse
+# is always redone, since an edit may add skills or sections; only the AI
+# results of the ResumeAnalysis returned by `reuse(resume_hash)` are kept.
+def analyze(pdf_bytes, pdf_name="resume.pdf", nlp=None, fast=False, parallel=False, max_pages=None, timer=None,
+            duplicates=None, reuse=None) -> ResumeAnalysis:
+    stage = timer.stage if timer else _no_stage
+    with stage("extract"):
+        pages = extract_pages(pdf_bytes, max_pages=max_pages, fast=fast, parallel=parallel, ocr=OCR_FALLBACK)
+    resume_text = ''.join(pages)
+    resume_hash = content_hash(pdf_bytes)
+    if duplicates is not None:
+        with stage("dedupe"):
+            resume_hash = duplicates.canonical(resume_hash, resume_text)
+    analysis = analyze_text(resume_text, pdf_name, resume_hash, nlp, len(pages), timer)
+    prior = reuse(resume_hash) if duplicates is not None and reuse else None
+    if prior is not None:
+        analysis.ai_pitch = prior.ai_pitch
+    return analysis
+
+def _no_stage(name):
+    return nullcontext()
@@ -0,0 +1,298 @@
+import asyncio
+import datetime
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from fastapi import FastAPI, File, HTTPException, Query, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from Analyzer import analyze, get_nlp
+from Batch import iter_files
+from Cache import ResultCache, TTLCache, content_hash
+from Courses import catalog
+from Database import USER_COLLECTION, ensure_indexes
+from Gemini import GeminiClient, GeminiUnavailable, pitch_prompt
+from Metrics import REGISTRY, observe
+from Persistence import WriteBehindWriter
+
+logger = logging.getLogger("resume_analyzer.api")
+
+# ---------- Configuration ----------
+# Read from the environment so API workers can be scaled and tuned
+# independently of the Streamlit app:
+#   uvicorn Api:app --host 0.0.0.0 --port 8000
+API_WORKERS = int(os.environ.get("API_WORKERS", os.cpu_count() or 1))
+API_MAX_QUEUE = int(os.environ.get("API_MAX_QUEUE", 200))
+API_MAX_UPLOAD_MB = float(os.environ.get("API_MAX_UPLOAD_MB", 10))
+API_WAIT_TIMEOUT = float(os.environ.get("API_WAIT_TIMEOUT", 60))
+API_JOB_TTL = float(os.environ.get("API_JOB_TTL", 3600))
+API_AI_PITCH = os.environ.get("API_AI_PITCH", "1") == "1"
+API_PITCH_CONCURRENCY = int(os.environ.get("API_PITCH_CONCURRENCY", os.environ.get("GEMINI_MAX_CONCURRENCY", 4)))
+MONGO_URI = os.environ.get("MONGO_URI")
+MONGO_DB = os.environ.get("MONGO_DB", "resume_analyzer")
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
+
+MAX_UPLOAD_BYTES = int(API_MAX_UPLOAD_MB * 1024 * 1024)
+
+# ---------- Jobs ----------
+@dataclass
+class Job:
+    id: str
+    kind: str
+    total: int
+    status: str = "queued"
+    done: int = 0
+    failed: int = 0
+    results: List[dict] = field(default_factory=list)
+    errors: List[dict] = field(default_factory=list)
+    created: float = field(default_factory=time.time)
+    finished: Optional[float] = None
+    event: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "results": self.results,
+            "errors": self.errors,
+            "created": self.created,
+            "finished": self.finished
+        }
+
+class QueueFull(Exception):
+    pass
+
+# ---------- Analysis Service ----------
+# Uploads are queued on a bounded asyncio queue and drained by one consumer
+# per worker process, so at most `workers` PDFs are being parsed at once.
+# Extraction and NLP run in the process pool via Analyzer.analyze, exactly
+# as in the Streamlit app. Each Gemini pitch then runs as its own task,
+# at most `pitch_concurrency` at a time, so a consumer goes straight back to
+# the queue and the pool never idles behind LLM latency. Queued uploads and
+# pending pitches together are capped at `max_queue`; beyond that requests
+# are refused with 429 instead of piling up in memory. The MongoDB
+# write-behind queue runs on its own thread.
+class AnalysisService:
+    def __init__(self, workers=API_WORKERS, max_queue=API_MAX_QUEUE, job_ttl=API_JOB_TTL,
+                 gemini=None, writer=None, result_cache=None, pitch_concurrency=API_PITCH_CONCURRENCY):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.pitch_concurrency = pitch_concurrency
+        self.gemini = gemini
+        self.writer = writer
+        self.result_cache = result_cache or ResultCache()
+        self.jobs = TTLCache(ttl=job_ttl, max_items=100000)
+        self.queue = None
+        self.pool = None
+        self._consumers = []
+        self._pitches = set()
+        self._pitch_slots = None
+
+    async def start(self):
+        self.queue = asyncio.Queue(maxsize=self.max_queue)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=get_nlp)
+        self._pitch_slots = asyncio.Semaphore(self.pitch_concurrency)
+        self._consumers = [asyncio.create_task(self._consume()) for _ in range(self.workers)]
+
+    async def stop(self):
+        tasks = self._consumers + list(self._pitches)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        if self.writer is not None:
+            await asyncio.to_thread(self.writer.close)
+
+    def queued(self):
+        return self.queue.qsize() if self.queue else 0
+
+    def pending_pitches(self):
+        return len(self._pitches)
+
+    def submit(self, kind, items):
+        room = self.max_queue - self.queue.qsize() - len(self._pitches)
+        if room < len(items):
+            raise QueueFull(f"queue has room for {max(room, 0)} of {len(items)} resumes")
+        job = Job(uuid.uuid4().hex, kind, len(items))
+        self.jobs.set(job.id, job)
+        for name, data in items:
+            self.queue.put_nowait((job, name, data, time.perf_counter()))
+        if not items:
+            self._finish(job)
+        return job
+
+    def _finish(self, job):
+        job.status = "failed" if job.failed and not job.done else "done"
+        job.finished = time.time()
+        job.event.set()
+
+    def _record(self, job, result=None, error=None):
+        if error is not None:
+            job.errors.append(error)
+            job.failed += 1
+        else:
+            job.results.append(result)
+            job.done += 1
+        if job.done + job.failed == job.total:
+            self._finish(job)
+
+    async def _consume(self):
+        while True:
+            job, name, data, enqueued = await self.queue.get()
+            job.status = "running"
+            observe("api_queue_wait", time.perf_counter() - enqueued)
+            start = time.perf_counter()
+            try:
+                resume_hash, analysis, courses = await self._analyze(name, data, job.kind)
+            except Exception as e:
+                logger.exception("analysis failed for %s", name)
+                self._record(job, error={"pdf_name": name, "error": str(e)})
+            else:
+                if self.gemini is not None and analysis.ai_pitch is None:
+                    task = asyncio.create_task(self._pitch_and_record(job, name, resume_hash, analysis, courses, start))
+                    self._pitches.add(task)
+                    task.add_done_callback(self._pitches.discard)
+                else:
+                    self._record(job, self._result(name, analysis, courses, start))
+            finally:
+                self.queue.task_done()
+
+    async def _analyze(self, name, data, source):
+        resume_hash = content_hash(data)
+        analysis = self.result_cache.get(resume_hash)
+        if analysis is None:
+            loop = asyncio.get_running_loop()
+            analysis = await loop.run_in_executor(self.pool, analyze, data, name)
+            self.result_cache.set(resume_hash, analysis)
+        courses = catalog.recommend(analysis.reco_field, analysis.recommended_skills, analysis.skills)
+
+        if self.writer is not None:
+            record = analysis.to_record()
+            record.update({
+                "recommended_courses": [c.title for c in courses],
+                "pdf_name": name,
+                "source": source,
+                "timestamp": datetime.datetime.now().strftime('%Y-%m-%d_%H:%M:%S')
+            })
+            self.writer.submit(record)
+        return resume_hash, analysis, courses
+
+    async def _pitch_and_record(self, job, name, resume_hash, analysis, courses, start):
+        try:
+            async with self._pitch_slots:
+                if analysis.ai_pitch is None:
+                    pitch = await asyncio.to_thread(self.gemini.generate, pitch_prompt(analysis))
+                    if pitch:
+                        analysis.ai_pitch = pitch
+                        self.result_cache.set(resume_hash, analysis)
+        except GeminiUnavailable as e:
+            logger.warning("pitch unavailable for %s: %s", name, e)
+        except Exception:
+            logger.exception("pitch failed for %s", name)
+        self._record(job, self._result(name, analysis, courses, start))
+
+    def _result(self, name, analysis, courses, start):
+        result = analysis.to_dict()
+        result.pop("resume_text", None)
+        result["pdf_name"] = name
+        result["recommended_courses"] = [{"title": c.title, "url": c.url} for c in courses]
+        observe("api_analyze", time.perf_counter() - start)
+        return result
+
+def build_service():
+    writer = gemini = None
+    if MONGO_URI:
+        from pymongo import MongoClient
+        db = MongoClient(MONGO_URI)[MONGO_DB]
+        try:
+            ensure_indexes(db)
+        except Exception as e:
+            logger.warning("could not ensure indexes: %s", e)
+        writer = WriteBehindWriter(db[USER_COLLECTION],
+                                   flush_size=int(os.environ.get("DB_FLUSH_SIZE", 100)),
+                                   flush_interval=float(os.environ.get("DB_FLUSH_INTERVAL", 2.0)))
+    if GEMINI_API_KEY and API_AI_PITCH:
+        gemini = GeminiClient(GEMINI_API_KEY,
+                              timeout=float(os.environ.get("GEMINI_TIMEOUT", 30)),
+                              max_concurrency=int(os.environ.get("GEMINI_MAX_CONCURRENCY", 4)))
+    result_cache = ResultCache(max_items=int(os.environ.get("RESULT_CACHE_SIZE", 128)),
+                               disk_dir=os.environ.get("RESULT_CACHE_DIR"))
+    return AnalysisService(gemini=gemini, writer=writer, result_cache=result_cache)
+
+# ---------- HTTP ----------
+@asynccontextmanager
+async def lifespan(app):
+    service = build_service()
+    await service.start()
+    app.state.service = service
+    try:
+        yield
+    finally:
+        await service.stop()
+
+app = FastAPI(title="AI Resume Analyzer API", lifespan=lifespan)
+
+async def _read_upload(upload):
+    data = await upload.read(MAX_UPLOAD_BYTES + 1)
+    if len(data) > MAX_UPLOAD_BYTES:
+        raise HTTPException(413, f"{upload.filename} is larger than {API_MAX_UPLOAD_MB:g} MB")
+    return upload.filename or "resume.pdf", data
+
+def _enqueue(kind, items):
+    try:
+        return app.state.service.submit(kind, items)
+    except QueueFull as e:
+        raise HTTPException(429, str(e), headers={"Retry-After": "5"})
+
+@app.post("/analyze")
+async def analyze_resume(file: UploadFile = File(...), wait: bool = Query(True)):
+    name, data = await _read_upload(file)
+    if not name.lower().endswith(".pdf"):
+        raise HTTPException(415, "only PDF files are accepted")
+    job = _enqueue("api", [(name, data)])
+    if wait:
+        try:
+            await asyncio.wait_for(asyncio.shield(job.event.wait()), API_WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+    if job.event.is_set():
+        if job.errors:
+            raise HTTPException(422, job.errors[0]["error"])
+        return job.results[0]
+    return JSONResponse(job.to_dict(), status_code=202)
+
+# Accepts PDFs and ZIP archives of PDFs; returns a job to poll.
+@app.post("/batch", status_code=202)
+async def analyze_batch(files: List[UploadFile] = File(...)):
+    uploads = [await _read_upload(f) for f in files]
+    items = list(iter_files(uploads))
+    if not items:
+        raise HTTPException(400, "no PDF files found in upload")
+    return _enqueue("api_batch", items).to_dict()
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    job = app.state.service.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(404, "unknown or expired job")
+    return job.to_dict()
+
+@app.get("/healthz")
+async def health():
+    service = app.state.service
+    return {"status": "ok", "queued": service.queued(), "pending_pitches": service.pending_pitches(),
+            "max_queue": service.max_queue, "workers": service.workers}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return REGISTRY.render_prometheus()
@@ -1,26 +1,26 @@
 import streamlit as st
-import nltk
-import spacy
 import secrets
-import socket
-import platform
-import pandas as pd
-import base64, random
+import logging
+import html
+import random
 import time, datetime
-import os
-import getpass
-import geocoder
-import io
-from pdfminer.layout import LAParams
-from pdfminer.pdfpage import PDFPage
-from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
-from pdfminer.converter import TextConverter
+import tempfile
+import tracemalloc
 from streamlit_tags import st_tags
 from PIL import Image
-import re
-from pymongo import MongoClient
-import plotly.express as px
-from geopy.geocoders import Nominatim
+from Cache import ResultCache, content_hash
+from Analyzer import analyze
+from Batch import run_batch, iter_uploads
+from Gemini import GeminiClient, GeminiUnavailable, pitch_prompt
+from Database import ensure_indexes, build_filter, fetch_page, distinct_values, export_csv, projection, USER_FIELDS, FEEDBACK_FIELDS, SEARCH_FIELDS
+from Analytics import feedback_score_counts, user_overview, invalidate as invalidate_analytics
+from Persistence import WriteBehindWriter
+from Context import GeoLookup, RESOLVERS, geocoder_resolver
+from Metrics import StageTimer, REGISTRY, maybe_profile
+from Uploads import UploadStore
+from Search import SearchIndex
+from Dedupe import DuplicateIndex
+from Startup import timed_import, warm_up_in_background, report as startup_report
 
 # ---------- Streamlit Page Config ----------
 st.set_page_config(
@@ -29,90 +29,172 @@ st.set_page_config(
     layout="wide"
 )
 
-# ---------- Load NLTK ----------
-@st.cache_resource
-def load_nltk():
-    import nltk
-    nltk.download('stopwords')
-    nltk.download('punkt')
-    nltk.download('wordnet')
-    nltk.download('averaged_perceptron_tagger')
-
-load_nltk()
-
-# ---------- Load SpaCy ----------
-nlp = spacy.load("en_core_web_sm")
+# Heavy dependencies (pymongo, Gemini, spaCy, pandas, plotly, geocoder) are
+# loaded the first time a page needs them, not at script start.
+if st.secrets.get("WARM_UP_ON_START", False):
+    warm_up_in_background()
 
 # ---------- MongoDB Connection ----------
 @st.cache_resource
 def get_mongo_client():
-    return MongoClient(st.secrets["MONGO_URI"])
+    pymongo = timed_import("pymongo")
+    return pymongo.MongoClient(st.secrets["MONGO_URI"])
 
-mongo_client = get_mongo_client()
-db = mongo_client["resume_analyzer"]
-user_collection = db["user_data"]
-feedback_collection = db["user_feedback"]
+def get_db():
+    return get_mongo_client()["resume_analyzer"]
 
-# ---------- AI Client ----------
-from google import genai
-client = genai.Client(api_key=st.secrets["GEMINI_API_KEY"])
+logger = logging.getLogger("resume_analyzer.app")
 
-def get_gemini_response(prompt: str) -> str:
+@st.cache_resource
+def ensure_db_indexes():
     try:
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=prompt
-        )
-        return response.text.strip()
+        ensure_indexes(get_db())
     except Exception as e:
+        logger.warning("could not ensure indexes: %s", e)
+
+# Records are upserted on resume_hash, so its unique index must exist
+# before the first write.
+@st.cache_resource
+def get_record_writer():
+    ensure_db_indexes()
+    return WriteBehindWriter(
+        get_db()["user_data"],
+        flush_size=int(st.secrets.get("DB_FLUSH_SIZE", 100)),
+        flush_interval=float(st.secrets.get("DB_FLUSH_INTERVAL", 2.0))
+    )
+
+# ---------- Candidate Search ----------
+@st.cache_resource
+def get_search_index():
+    return SearchIndex.load(st.secrets.get("SEARCH_INDEX_PATH", "./search_index.pkl"))
+
+# ---------- Near-duplicate Uploads ----------
+@st.cache_resource
+def get_duplicate_index():
+    if not st.secrets.get("NEAR_DUP_DETECTION", True):
+        return None
+    return DuplicateIndex(st.secrets.get("NEAR_DUP_INDEX", "./near_duplicates.log"),
+                          threshold=float(st.secrets.get("NEAR_DUP_THRESHOLD", 0.8)))
+
+# ---------- Upload Storage ----------
+@st.cache_resource
+def get_upload_store():
+    return UploadStore(
+        root=st.secrets.get("UPLOAD_DIR", "./Uploaded_Resumes"),
+        max_bytes=int(float(st.secrets.get("UPLOAD_MAX_MB", 500)) * 1024 * 1024),
+        max_age=float(st.secrets.get("UPLOAD_MAX_AGE_DAYS", 7)) * 24 * 3600,
+        persist=bool(st.secrets.get("PERSIST_UPLOADS", True))
+    )
+
+# ---------- Host & Geo Context ----------
+@st.cache_resource
+def get_geo_lookup():
+    return GeoLookup(RESOLVERS.get(st.secrets.get("GEO_RESOLVER", "geocoder"), geocoder_resolver))
+
+def client_ip():
+    try:
+        forwarded = st.context.headers.get("X-Forwarded-For", "")
+    except Exception:
+        forwarded = ""
+    return forwarded.split(",")[0].strip() or "me"
+
+# ---------- Instrumentation ----------
+PROFILE_SAMPLE_RATE = float(st.secrets.get("PROFILE_SAMPLE_RATE", 0.0))
+METRICS_FILE = st.secrets.get("METRICS_FILE")
+
+@st.cache_resource
+def start_tracemalloc():
+    if st.secrets.get("TRACEMALLOC", False):
+        tracemalloc.start()
+
+start_tracemalloc()
+
+def finish_timing(timer):
+    if timer.stages:
+        timer.finish()
+        if METRICS_FILE:
+            REGISTRY.write_prometheus(METRICS_FILE)
+
+# ---------- AI Client ----------
+@st.cache_resource
+def get_gemini_client():
+    return GeminiClient(
+        api_key=st.secrets["GEMINI_API_KEY"],
+        timeout=float(st.secrets.get("GEMINI_TIMEOUT", 30)),
+        max_concurrency=int(st.secrets.get("GEMINI_MAX_CONCURRENCY", 4)),
+        cache_collection=get_db()["ai_responses"] if st.secrets.get("AI_CACHE_IN_MONGO", False) else None
+    )
+
+AI_FALLBACK = "AI Service temporarily unavailable."
+AI_RETRY_SECONDS = float(st.secrets.get("AI_RETRY_SECONDS", 60))
+
+def show_ai_error(e):
+    if e.quota_exceeded:
+        st.warning("AI quota reached. Please try again in a minute.")
+    else:
         st.error(f"AI Error: {e}")
-        return "AI Service temporarily unavailable."
+
+# Renders the reply as it arrives. Returns the full text, or None when the
+# call failed (even after some text was shown) or produced nothing, so a
+# partial or empty reply is never cached.
+def write_gemini_stream(prompt: str):
+    failures = []
+
+    def chunks():
+        try:
+            yield from get_gemini_client().stream(prompt)
+        except GeminiUnavailable as e:
+            failures.append(e)
+            show_ai_error(e)
+            yield AI_FALLBACK
+
+    text = st.write_stream(chunks())
+    text = text.strip() if isinstance(text, str) else ""
+    return None if failures or not text else text
 
 # ---------- Helper Functions ----------
-def get_csv_download_link(df,filename,text):
-    csv = df.to_csv(index=False)
-    b64 = base64.b64encode(csv.encode()).decode()
-    href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">{text}</a>'
-    return href
-
-def pdf_reader(file):
-    resource_manager = PDFResourceManager()
-    fake_file_handle = io.StringIO()
-    converter = TextConverter(resource_manager, fake_file_handle, laparams=LAParams())
-    page_interpreter = PDFPageInterpreter(resource_manager, converter)
-    with open(file, 'rb') as fh:
-        for page in PDFPage.get_pages(fh, caching=True, check_extractable=True):
-            page_interpreter.process_page(page)
-        text = fake_file_handle.getvalue()
-    converter.close()
-    fake_file_handle.close()
-    return text
-
-def show_pdf(file_path):
+def show_pdf(pdf_bytes, file_name):
     try:
-        with open(file_path, "rb") as f:
-            st.download_button(
-                label="📥 Download Resume PDF",
-                data=f,
-                file_name=os.path.basename(file_path),
-                mime="application/pdf"
-            )
+        st.download_button(
+            label="📥 Download Resume PDF",
+            data=pdf_bytes,
+            file_name=file_name,
+            mime="application/pdf"
+        )
         st.info("📄 PDF preview is disabled on Streamlit Cloud. Download to view.")
     except Exception as e:
         st.error(f"Unable to load PDF: {e}")
 
-def course_recommender(course_list):
+def course_recommender(reco_field, wanted, have):
     st.subheader("**Courses & Certificates Recommendations 👨‍🎓**")
     rec_course = []
     no_of_reco = st.slider('Choose Number of Course Recommendations:', 1, 10, 5)
-    random.shuffle(course_list)
-    for c, (c_name, c_link) in enumerate(course_list[:no_of_reco], 1):
-        st.markdown(f"({c}) [{c_name}]({c_link})")
-        rec_course.append(c_name)
+    for c, course in enumerate(catalog.recommend(reco_field, wanted, have, no_of_reco), 1):
+        st.markdown(f"({c}) [{course.title}]({course.url})")
+        rec_course.append(course.title)
     return rec_course
 
 # ---------- Courses & Videos ----------
-from Courses import ds_course, web_course, android_course, ios_course, uiux_course, resume_videos, interview_videos
+from Courses import catalog, resume_videos, interview_videos
+
+LEVEL_MESSAGES = {
+    "NA": '''<h4 style='text-align: left; color: #d73b5c;'>You are at Fresher level!</h4>''',
+    "Intermediate": '''<h4 style='text-align: left; color: #1ed760;'>You are at intermediate level!</h4>''',
+    "Experienced": '''<h4 style='text-align: left; color: #fba171;'>You are at experience level!''',
+    "Fresher": '''<h4 style='text-align: left; color: #fba171;'>You are at Fresher level!!''',
+}
+
+# Levels from a custom SECTIONS_CONFIG have no entry above.
+def level_message(level):
+    return LEVEL_MESSAGES.get(level, f"<h4 style='text-align: left; color: #1ed760;'>You are at {html.escape(level)} level!</h4>")
+
+# ---------- Analysis Result Cache ----------
+@st.cache_resource
+def get_result_cache():
+    return ResultCache(
+        max_items=int(st.secrets.get("RESULT_CACHE_SIZE", 128)),
+        disk_dir=st.secrets.get("RESULT_CACHE_DIR")
+    )
 
 # ---------- Main App ----------
 def run():
@@ -128,102 +210,73 @@ def run():
 
     # ---------- USER SIDE ----------
     if choice == 'User':
+        warm_up_in_background()
         act_name = st.text_input('Name*')
         act_mail = st.text_input('Mail*')
         act_mob  = st.text_input('Mobile Number*')
 
         sec_token = secrets.token_urlsafe(12)
-        host_name = socket.gethostname()
-        ip_add = socket.gethostbyname(host_name)
-        dev_user = getpass.getuser()
-        os_name_ver = platform.system() + " " + platform.release()
-
-        try:
-            g = geocoder.ip('me')
-            latlong = g.latlng if g.latlng else [0, 0]  # fallback
-            city = g.city if hasattr(g, 'city') else ''
-            state = g.state if hasattr(g, 'state') else ''
-            country = g.country if hasattr(g, 'country') else ''
-        except Exception:
-            latlong = [0, 0]
-            city = state = country = "Unknown"
+        # Geo lookup starts in the background and is cached per client IP;
+        # nothing on this page waits for it.
+        geo_ip = client_ip()
+        get_geo_lookup().lookup(geo_ip)
 
         st.markdown("<h5 style='text-align: left;'>Upload Your Resume, And Get Smart Recommendations</h5>",unsafe_allow_html=True)
         pdf_file = st.file_uploader("Choose your Resume", type=["pdf"])
 
         if pdf_file is not None:
-            with st.spinner('Hang On While We Cook Magic For You...'):
-                time.sleep(4)
+            pdf_bytes = pdf_file.getvalue()
+            resume_hash = content_hash(pdf_bytes)
+            result_cache = get_result_cache()
 
-            os.makedirs('./Uploaded_Resumes', exist_ok=True)
-            save_image_path = './Uploaded_Resumes/' + pdf_file.name
             pdf_name = pdf_file.name
-            with open(save_image_path, "wb") as f:
-                f.write(pdf_file.getbuffer())
-            show_pdf(save_image_path)
-
-            resume_text = pdf_reader(save_image_path)
-            doc = nlp(resume_text)
-
-            # ---- Extract Name ----
-            lines = [line.strip() for line in resume_text.split('\n') if line.strip()]
-            blacklist = {'Pandas', 'Numpy', 'Spacy', 'Java', 'React', 'Python', 'Resume', 'CV', 'Page'}
-            extracted_name = None
-            for line in lines[:3]:
-                line_doc = nlp(line)
-                for ent in line_doc.ents:
-                    if ent.label_ == "PERSON" and ent.text.strip() not in blacklist:
-                        extracted_name = ent.text.strip()
-                        break
-                if extracted_name: break
-            if not extracted_name:
-                fn = pdf_file.name.split('.')[0]
-                fn = re.sub(r'(?i)(resume|cv|final|updated|v\d+|20\d{2}|20\d{1})', '', fn)
-                fn = re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', fn)
-                fn = re.sub(r'(_|-|\.)', ' ', fn)
-                extracted_name = ' '.join(fn.split()).title()
-            if not extracted_name or len(extracted_name) < 2:
-                extracted_name = "Candidate"
-
-            # ---- Extract Email & Phone ----
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+', resume_text)
-            phone_match = re.search(r'(\d{10}|\(\d{3}\)\s*\d{3}[-\.\s]??\d{4}|\d{3}[-\.\s]??\d{3}[-\.\s]??\d{4})', resume_text)
-            email = email_match.group(0) if email_match else None
-            phone = phone_match.group(0) if phone_match else None
-
-            # ---- Keywords & Skills ----
-            ds_keyword = ['tensorflow','keras','pytorch','machine learning','deep learning','nlp','pandas','numpy','scikit-learn','streamlit','genai','semantic analysis']
-            web_keyword = ['react', 'react.js', 'next.js','node.js', 'node js', 'express', 'express.js','mongodb', 'mongo db','javascript', 'html', 'css', 'tailwind','jwt', 'rest api', 'rest apis','prisma', 'mysql', 'socket.io']
-            android_keyword = ['android','android development','flutter','kotlin','xml','kivy']
-            ios_keyword = ['ios','ios development','swift','cocoa','cocoa touch','xcode']
-            uiux_keyword = ['adobe xd', 'figma', 'zeplin', 'balsamiq','prototyping', 'wireframes','adobe photoshop', 'illustrator','after effects', 'indesign','user research', 'user experience']
-            soft_skills = ['english','communication','writing','microsoft office','leadership','customer management','social media']
-
-            all_possible_skills = ds_keyword + web_keyword + android_keyword + ios_keyword + uiux_keyword + soft_skills
-        
-            found_skills = []
-            for skill in all_possible_skills:
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                if re.search(pattern, resume_text.lower()):
-                    found_skills.append(skill)
-
-
+            get_upload_store().put(pdf_file, resume_hash)
+            show_pdf(pdf_bytes, pdf_name)
+
+            # Basic info, skills and score render as soon as the parse is
+            # done; the AI pitch streams into its slot afterwards.
+            timer = StageTimer(resume_hash=resume_hash[:12], pdf_pages=None)
+            analysis = result_cache.get(resume_hash)
+            if analysis is None:
+                with st.spinner('Hang On While We Cook Magic For You...'), maybe_profile("analyze", PROFILE_SAMPLE_RATE):
+                    analysis = analyze(pdf_bytes, pdf_name, parallel=True, timer=timer,
+                                       duplicates=get_duplicate_index(), reuse=result_cache.get)
+                timer.context["pdf_pages"] = analysis.no_of_pages
+                result_cache.set(resume_hash, analysis)
+            # Near-duplicates of an earlier upload carry its hash, so AI
+            # results and the stored record are shared instead of repeated;
+            # skills, score and level always come from this upload.
+            upload_hash, resume_hash = resume_hash, analysis.resume_hash
+            if resume_hash != upload_hash:
+                st.info("This looks like an edited version of a resume analyzed before; it is linked to the earlier record and reuses its AI summary.")
+
+            resume_text = analysis.resume_text
             resume_data = {
-                "name": extracted_name,
-                "email": email,
-                "mobile_number": phone,
-                "skills": list(set(found_skills)),
-                "no_of_pages": 1
+                "name": analysis.name,
+                "email": analysis.email,
+                "mobile_number": analysis.mobile_number,
+                "skills": analysis.skills,
+                "no_of_pages": analysis.no_of_pages
             }
+            cand_level = analysis.cand_level
+            reco_field = analysis.reco_field
+            recommended_skills = analysis.recommended_skills
+            resume_score = analysis.resume_score
+            rec_course = []
 
             st.header("**Resume Analysis**")
             st.success("Hello "+ resume_data['name'])
 
             st.subheader("🤖 AI Summary")
-            with st.spinner('Generating AI Pitch...'):
-                pitch_prompt = f"Summarize this resume into a 2-line professional pitch: {resume_text[:2500]}"
-                ai_pitch = get_gemini_response(pitch_prompt)
-                st.info(ai_pitch)
+            pitch_box = st.container()
+            # A pitch that failed is retried only once AI_RETRY_SECONDS have
+            # passed, not on every widget rerun.
+            failed_pitches = st.session_state.setdefault("failed_pitches", {})
+            pitch_backoff = time.time() - failed_pitches.get(resume_hash, 0) < AI_RETRY_SECONDS
+            if analysis.ai_pitch is not None:
+                pitch_box.info(analysis.ai_pitch)
+            elif pitch_backoff:
+                pitch_box.info(AI_FALLBACK)
 
             st.subheader("*Your Basic info 👀*")
             try:
@@ -235,43 +288,7 @@ def run():
 
             except:
                 pass
-            ## Predicting Candidate Experience Level 
-            ## Trying with different possibilities
-            cand_level = ''
-            if resume_data['no_of_pages'] < 1:
-                cand_level = "NA"
-                st.markdown( '''<h4 style='text-align: left; color: #d73b5c;'>You are at Fresher level!</h4>''',unsafe_allow_html=True)
-
-            #### if internship then intermediate level
-            elif 'INTERNSHIP' in resume_text:
-                cand_level = "Intermediate"
-                st.markdown('''<h4 style='text-align: left; color: #1ed760;'>You are at intermediate level!</h4>''',unsafe_allow_html=True)
-            elif 'INTERNSHIPS' in resume_text:
-                cand_level = "Intermediate"
-                st.markdown('''<h4 style='text-align: left; color: #1ed760;'>You are at intermediate level!</h4>''',unsafe_allow_html=True)
-            elif 'Internship' in resume_text:
-                cand_level = "Intermediate"
-                st.markdown('''<h4 style='text-align: left; color: #1ed760;'>You are at intermediate level!</h4>''',unsafe_allow_html=True)
-            elif 'Internships' in resume_text:
-                cand_level = "Intermediate"
-                st.markdown('''<h4 style='text-align: left; color: #1ed760;'>You are at intermediate level!</h4>''',unsafe_allow_html=True)
-
-            #### if Work Experience/Experience then Experience level
-            elif 'EXPERIENCE' in resume_text:
-                cand_level = "Experienced"
-                st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at experience level!''',unsafe_allow_html=True)
-            elif 'WORK EXPERIENCE' in resume_text:
-                cand_level = "Experienced"
-                st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at experience level!''',unsafe_allow_html=True)
-            elif 'Experience' in resume_text:
-                cand_level = "Experienced"
-                st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at experience level!''',unsafe_allow_html=True)
-            elif 'Work Experience' in resume_text:
-                cand_level = "Experienced"
-                st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at experience level!''',unsafe_allow_html=True)
-            else:
-                cand_level = "Fresher"
-                st.markdown('''<h4 style='text-align: left; color: #fba171;'>You are at Fresher level!!''',unsafe_allow_html=True)
+            st.markdown(level_message(cand_level), unsafe_allow_html=True)
             
             # ---- Skill Recommendation ----
             st.subheader("**Skills Recommendation 💡**")
@@ -280,107 +297,12 @@ def run():
                 value=resume_data['skills'],
                 key = 'user_skills')
 
-            reco_field = ''
-            recommended_skills = []
-            rec_course = []
-
-            # old logic!!!
-            # for i in resume_data['skills']:
-            #     if i.lower() in ds_keyword:
-            #         reco_field = 'Data Science'
-            #         recommended_skills = ['Data Visualization','Predictive Analysis','Statistical Modeling','Data Mining','Clustering & Classification','Data Analytics','Quantitative Analysis','Web Scraping','ML Algorithms','Keras','Pytorch','Probability','Scikit-learn','Tensorflow','Flask','Streamlit']
-            #         recommended_keywords = st_tags(label='### Recommended skills for you.',
-            #             text='Recommended skills generated from System',
-            #             value=recommended_skills,key = 'rec_ds')
-            #         rec_course = course_recommender(ds_course)
-            #         break
-            #     elif i.lower() in web_keyword:
-            #         reco_field = 'Web Development'
-            #         recommended_skills = ['React','Django','Node JS','React JS','php','laravel','Magento','wordpress','Javascript','Angular JS','c#','Flask','SDK']
-            #         recommended_keywords = st_tags(label='### Recommended skills for you.',
-            #             text='Recommended skills generated from System',
-            #             value=recommended_skills,key = 'rec_web')
-            #         rec_course = course_recommender(web_course)
-            #         break
-            #     elif i.lower() in android_keyword:
-            #         reco_field = 'Android Development'
-            #         recommended_skills = ['Android','Android development','Flutter','Kotlin','XML','Java','Kivy','GIT','SDK','SQLite']
-            #         recommended_keywords = st_tags(label='### Recommended skills for you.',
-            #             text='Recommended skills generated from System',
-            #             value=recommended_skills,key = 'rec_android')
-            #         rec_course = course_recommender(android_course)
-            #         break
-            #     elif i.lower() in ios_keyword:
-            #         reco_field = 'IOS Development'
-            #         recommended_skills = ['IOS','IOS Development','Swift','Cocoa','Cocoa Touch','Xcode','Objective-C','SQLite','Plist','StoreKit','UI-Kit','AV Foundation','Auto-Layout']
-            #         recommended_keywords = st_tags(label='### Recommended skills for you.',
-            #             text='Recommended skills generated from System',
-            #             value=recommended_skills,key = 'rec_ios')
-            #         rec_course = course_recommender(ios_course)
-            #         break
-            #     elif i.lower() in uiux_keyword:
-            #         reco_field = 'UI-UX Development'
-            #         recommended_skills = ['UI','User Experience','Adobe XD','Figma','Zeplin','Balsamiq','Prototyping','Wireframes','Storyframes','Adobe Photoshop','Editing','Illustrator','After Effects','Premier Pro','Indesign','Wireframe','Solid','Grasp','User Research']
-            #         recommended_keywords = st_tags(label='### Recommended skills for you.',
-            #             text='Recommended skills generated from System',
-            #             value=recommended_skills,key = 'rec_uiux')
-            #         rec_course = course_recommender(uiux_course)
-            #         break
-            #     elif i.lower() in n_any:
-            #         reco_field = 'NA'
-            #         recommended_skills = ['No Recommendations']
-            #         recommended_keywords = st_tags(label='### Recommended skills for you.',
-            #             text='Currently No Recommendations',value=recommended_skills,key = 'rec_na')
-            #         rec_course = ["Not Available"]
-            #         break
-
-            field_scores = {"Data Science": 0,"Web Development": 0,"Android Development": 0,"IOS Development": 0,"UI-UX Development": 0}
-
-            for skill in resume_data['skills']:
-                s = skill.lower()
-                if s in ds_keyword:
-                    field_scores["Data Science"] += 1
-                if s in web_keyword:
-                    field_scores["Web Development"] += 1   
-                if s in android_keyword:
-                    field_scores["Android Development"] += 1
-                if s in ios_keyword:
-                    field_scores["IOS Development"] += 1
-                if s in uiux_keyword:
-                    field_scores["UI-UX Development"] += 1
-
-            if max(field_scores.values()) == 0:
-                reco_field = "General / Undetermined"
-            else:
-                reco_field = max(field_scores, key=field_scores.get)
-
             # --------- Generate Recommendations ---------
 
             st.success(f"Predicted Field: {reco_field}")
 
-            if reco_field == "Data Science":
-                recommended_skills = ["Deep Learning", "Feature Engineering", "Model Deployment", "MLOps"]
-                rec_course = course_recommender(ds_course)
-
-            elif reco_field == "Web Development":
-                recommended_skills = ["System Design", "Advanced Backend Architecture", "Docker", "CI/CD"]
-                rec_course = course_recommender(web_course)
-
-            elif reco_field == "Android Development":
-                recommended_skills = ["Jetpack Compose", "Firebase", "MVVM Architecture"]
-                rec_course = course_recommender(android_course)
-
-            elif reco_field == "IOS Development":
-                recommended_skills = ["SwiftUI", "CoreData", "App Store Deployment"]
-                rec_course = course_recommender(ios_course)
-
-            elif reco_field == "UI-UX Development":
-                recommended_skills = ["Design Systems", "Interaction Design", "User Research"]
-                rec_course = course_recommender(uiux_course)
-
-            else:
-                recommended_skills = ["Problem Solving", "Communication"]
-                rec_course = []
+            if reco_field in catalog.fields():
+                rec_course = course_recommender(reco_field, recommended_skills, analysis.skills)
 
     # --------- Show Recommended Skills ---------
 
@@ -389,32 +311,36 @@ def run():
 
             # ---- Resume Score ----
             st.subheader("**Resume Score 📝**")
-            resume_score = 0
-            # same scoring logic as before
-            if 'Objective' in resume_text or 'Summary' in resume_text: resume_score+=6
-            if 'Education' in resume_text or 'School' in resume_text or 'College' in resume_text: resume_score+=12
-            if 'EXPERIENCE' in resume_text or 'Experience' in resume_text: resume_score+=16
-            if 'INTERNSHIPS' in resume_text or 'INTERNSHIP' in resume_text: resume_score+=6
-            if 'SKILLS' in resume_text or 'SKILL' in resume_text or 'Skills' in resume_text or 'Skill' in resume_text: resume_score+=7
-            if 'HOBBIES' in resume_text or 'Hobbies' in resume_text: resume_score+=4
-            if 'INTERESTS'in resume_text or 'Interests'in resume_text: resume_score+=5
-            if 'ACHIEVEMENTS' in resume_text or 'Achievements' in resume_text: resume_score+=13
-            if 'CERTIFICATIONS' in resume_text or 'Certifications' in resume_text or 'Certification' in resume_text: resume_score+=12
-            if 'PROJECTS' in resume_text or 'PROJECT' in resume_text or 'Projects' in resume_text or 'Project' in resume_text: resume_score+=19
-
-            my_bar = st.progress(0)
-            for percent_complete in range(resume_score):
-                time.sleep(0.05)
-                my_bar.progress(percent_complete + 1)
+            st.progress(min(resume_score, 100))
             st.success('** Your Resume Writing Score: ' + str(resume_score)+'**')
 
+            if analysis.ai_pitch is None and not pitch_backoff:
+                with pitch_box, timer.stage("llm"):
+                    ai_pitch = write_gemini_stream(pitch_prompt(analysis))
+                if ai_pitch is None:
+                    failed_pitches[resume_hash] = time.time()
+                else:
+                    failed_pitches.pop(resume_hash, None)
+                    analysis.ai_pitch = ai_pitch
+                    result_cache.set(upload_hash, analysis)
+                    original = result_cache.get(resume_hash) if resume_hash != upload_hash else None
+                    if original is not None and original.ai_pitch is None:
+                        original.ai_pitch = ai_pitch
+                        result_cache.set(resume_hash, original)
+
             # ---- Career Gap Analysis ----
             st.header("🎯 AI Career Path & Gap Analysis")
             target_job = st.selectbox("What is your target job?", ["Full Stack Developer", "Data Scientist", "DevOps Engineer", "Machine Learning Engineer", "UI/UX Designer"])
-            if st.button("Analyze My Career Gap"):
-                gap_prompt = f"Candidate wants to be a {target_job}. Current Skills: {resume_data['skills']}. Resume: {resume_text[:2000]}. 1. List 3 missing skills. 2. Suggest one project."
-                gap_analysis = get_gemini_response(gap_prompt)
+            gap_key = resume_hash + ":gap:" + target_job
+            gap_analysis = result_cache.get(gap_key)
+            if gap_analysis is not None:
                 st.markdown(gap_analysis)
+            elif st.button("Analyze My Career Gap"):
+                gap_prompt = f"Candidate wants to be a {target_job}. Current Skills: {resume_data['skills']}. Resume: {resume_text[:2000]}. 1. List 3 missing skills. 2. Suggest one project."
+                with timer.stage("llm_gap"):
+                    gap_analysis = write_gemini_stream(gap_prompt)
+                if gap_analysis is not None:
+                    result_cache.set(gap_key, gap_analysis)
 
             # ---- Bonus Videos ----
             st.header("**Bonus Video for Resume Writing Tips💡**")
@@ -422,28 +348,37 @@ def run():
             st.header("**Bonus Video for Interview Tips💡**")
             st.video(random.choice(interview_videos))
 
-            # ---- Insert into MongoDB ----
-            ts = time.time()
-            timestamp = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d_%H:%M:%S')
-            user_collection.insert_one({
+            # ---- Queue for MongoDB (write-behind, upserted on resume hash) ----
+            record = analysis.to_record()
+            record.update({
                 "act_name": act_name,
                 "act_mail": act_mail,
                 "act_mob": act_mob,
-                "candidate_name": resume_data["name"],
-                "candidate_email": resume_data["email"],
-                "resume_score": resume_score,
-                "total_pages": resume_data["no_of_pages"],
-                "predicted_field": reco_field,
-                "user_level": cand_level,
-                "actual_skills": resume_data["skills"],
-                "recommended_skills": recommended_skills,
                 "recommended_courses": rec_course,
                 "pdf_name": pdf_name,
-                "timestamp": timestamp
+                "last_upload_hash": upload_hash
             })
+            geo = get_geo_lookup().get(geo_ip)
+            if geo:
+                record.update(geo)
+            persisted = st.session_state.setdefault("persisted_records", {})
+            if persisted.get(resume_hash) != record:
+                ts = time.time()
+                timestamp = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d_%H:%M:%S')
+                writer = get_record_writer()
+                with timer.stage("enqueue"):
+                    queued = writer.submit(dict(record, timestamp=timestamp))
+                if queued:
+                    persisted[resume_hash] = record
+                if not geo:
+                    get_geo_lookup().when_ready(geo_ip, lambda g: writer.submit(dict(g, resume_hash=resume_hash)))
+
+            finish_timing(timer)
 
     # ---------- FEEDBACK SIDE ----------
     elif choice == 'Feedback':
+        px = timed_import("plotly.express")
+        feedback_collection = get_db()["user_feedback"]
         ts = time.time()
         timestamp = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d_%H:%M:%S')
 
@@ -462,14 +397,14 @@ def run():
                     "comments": comments,
                     "timestamp": timestamp
                 })
+                invalidate_analytics("feedback_scores")
                 st.success("Thanks! Your Feedback was recorded.")
                 st.balloons()
 
-        feedbacks = list(feedback_collection.find({}, {"_id":0}))
-        df_feedback = pd.DataFrame(feedbacks)
-        if not df_feedback.empty:
+        score_counts = feedback_score_counts(feedback_collection)
+        if score_counts:
             st.subheader("Past User Ratings")
-            fig = px.pie(df_feedback, values=df_feedback['feed_score'].value_counts(), names=df_feedback['feed_score'].value_counts().index)
+            fig = px.pie(values=[r["count"] for r in score_counts], names=[r["score"] for r in score_counts])
             st.plotly_chart(fig)
 
     # ---------- ABOUT PAGE ----------
@@ -497,17 +432,116 @@ def run():
 
         if st.session_state.admin_logged_in:
             st.success("Welcome Admin!")
+            pd = timed_import("pandas")
+            user_collection = get_db()["user_data"]
+            feedback_collection = get_db()["user_feedback"]
+
+            ensure_db_indexes()
 
-            users = list(user_collection.find({}, {"_id":0}))
-            df_users = pd.DataFrame(users)
+            # ---- User Data (filtered, sorted and paged in MongoDB) ----
             st.header("User Data")
-            st.dataframe(df_users)
-            st.markdown(get_csv_download_link(df_users, 'User_Data.csv', 'Download Report'), unsafe_allow_html=True)
+            f1, f2, f3 = st.columns(3)
+            field_filter = f1.selectbox("Predicted Field", ["All"] + distinct_values(user_collection, "predicted_field"))
+            level_filter = f2.selectbox("User Level", ["All"] + distinct_values(user_collection, "user_level"))
+            min_score = f3.number_input("Minimum Resume Score", 0, 100, 0)
+            s1, s2, s3 = st.columns(3)
+            sort_field = s1.selectbox("Sort By", ["timestamp", "resume_score", "predicted_field", "user_level"])
+            descending = s2.checkbox("Descending", value=True)
+            page_size = s3.selectbox("Rows Per Page", [25, 50, 100, 250], index=1)
+            query = build_filter(
+                None if field_filter == "All" else field_filter,
+                None if level_filter == "All" else level_filter,
+                min_score or None
+            )
+            user_page = st.number_input("Page", min_value=1, value=1, step=1, key="user_page")
+            users, total, pages = fetch_page(user_collection, query, USER_FIELDS, sort_field, descending, user_page, page_size)
+            st.caption(f"{total} records · page {min(user_page, pages)} of {pages}")
+            st.dataframe(pd.DataFrame(users))
+            if st.button("Prepare CSV Export"):
+                with st.spinner("Writing report..."):
+                    report_file = export_csv(user_collection, tempfile.TemporaryFile(), query)
+                st.download_button("Download Report", report_file, file_name="User_Data.csv", mime="text/csv")
+
+            # ---- Candidate Search (BM25 over stored resume text) ----
+            st.header("Candidate Search")
+            job_description = st.text_area("Paste a job description")
+            top_k = st.number_input("Candidates to show", min_value=5, max_value=200, value=25, step=5)
+            if job_description and st.button("Find Candidates"):
+                search_index = get_search_index()
+                with st.spinner("Updating search index..."):
+                    search_index.sync(user_collection)
+                start = time.perf_counter()
+                hits = search_index.search(job_description, int(top_k))
+                st.caption(f"Searched {len(search_index)} resumes in {1000 * (time.perf_counter() - start):.1f} ms")
+                if hits:
+                    ranks = {h: (i, score) for i, (h, score) in enumerate(hits, 1)}
+                    docs = user_collection.find({"resume_hash": {"$in": list(ranks)}},
+                                                projection(["resume_hash"] + SEARCH_FIELDS))
+                    rows = sorted((dict(doc, rank=ranks[doc["resume_hash"]][0], match=round(ranks[doc["resume_hash"]][1], 2))
+                                   for doc in docs), key=lambda r: r["rank"])
+                    st.dataframe(pd.DataFrame(rows, columns=["rank", "match"] + SEARCH_FIELDS))
+                else:
+                    st.info("No matching candidates")
 
-            feedbacks = list(feedback_collection.find({}, {"_id":0}))
-            df_feedback = pd.DataFrame(feedbacks)
             st.header("User Feedback Data")
-            st.dataframe(df_feedback)
+            feedback_page = st.number_input("Page", min_value=1, value=1, step=1, key="feedback_page")
+            feedbacks, total, pages = fetch_page(feedback_collection, None, FEEDBACK_FIELDS, page=feedback_page, page_size=50)
+            st.caption(f"{total} records · page {min(feedback_page, pages)} of {pages}")
+            st.dataframe(pd.DataFrame(feedbacks))
+
+            # ---- Talent Analytics ----
+            st.header("Talent Analytics")
+            px = timed_import("plotly.express")
+            overview = user_overview(user_collection)
+            m1, m2 = st.columns(2)
+            m1.metric("Resumes Analyzed", overview["total"])
+            m2.metric("Average Resume Score", f"{overview['avg_score']:.1f}")
+            c1, c2 = st.columns(2)
+            if overview["by_field"]:
+                c1.plotly_chart(px.bar(pd.DataFrame(overview["by_field"]), x="field", y="count", title="Predicted Field"))
+            if overview["by_level"]:
+                c2.plotly_chart(px.pie(pd.DataFrame(overview["by_level"]), values="count", names="level", title="Experience Level"))
+            if overview["score_histogram"]:
+                c1.plotly_chart(px.bar(pd.DataFrame(overview["score_histogram"]), x="score_from", y="count", title="Resume Score Distribution"))
+            if overview["top_skills"]:
+                c2.plotly_chart(px.bar(pd.DataFrame(overview["top_skills"]), x="count", y="skill", orientation="h", title="Top Skills"))
+            if overview["uploads_per_day"]:
+                c1.plotly_chart(px.line(pd.DataFrame(overview["uploads_per_day"]), x="day", y="count", title="Uploads Per Day"))
+            if overview["by_country"]:
+                c2.plotly_chart(px.bar(pd.DataFrame(overview["by_country"]), x="country", y="count", title="Candidate Location"))
+
+            # ---- Bulk Analysis ----
+            st.header("Bulk Resume Analysis")
+            batch_files = st.file_uploader("Upload resumes (PDFs or a ZIP of PDFs)", type=["pdf", "zip"], accept_multiple_files=True)
+            if batch_files and st.button("Analyze Batch"):
+                batch_bar = st.progress(0.0)
+                batch_status = st.empty()
+                def on_progress(n):
+                    batch_status.text(f"Processed {n} resumes...")
+                with st.spinner("Analyzing resumes across all cores..."):
+                    stats = run_batch(iter_uploads(batch_files), user_collection, on_progress=on_progress)
+                batch_bar.progress(1.0)
+                st.success(f"Analyzed {stats['analyzed']} resumes in {stats['seconds']:.1f}s ({stats['per_second']:.2f} resumes/sec)")
+                if stats["failed"]:
+                    st.warning(f"{stats['failed']} files could not be analyzed")
+                    st.dataframe(pd.DataFrame(stats["errors"]))
+
+            with st.expander("Stage timing"):
+                stage_rows = [{
+                    "stage": name,
+                    "count": s["count"],
+                    "avg wall ms": round(1000 * s["wall"] / s["count"], 2),
+                    "avg cpu ms": round(1000 * s["cpu"] / s["count"], 2),
+                    "peak KB": s["peak"] // 1024
+                } for name, s in sorted(REGISTRY.snapshot().items())]
+                st.table(stage_rows)
+                recent = REGISTRY.recent_entries()[-20:]
+                if recent:
+                    st.dataframe(pd.DataFrame([dict({"total_ms": e["total_ms"], "pages": e.get("pdf_pages")},
+                                                    **{k: v["wall_ms"] for k, v in e["stages"].items()}) for e in reversed(recent)]))
+
+            with st.expander("Startup timing"):
+                st.table([{"step": k, "seconds": round(v, 3)} for k, v in startup_report().items()])
 
 # ---------- Run App ----------
 run()
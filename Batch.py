@@ -0,0 +1,142 @@
+import argparse
+import datetime
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from Analyzer import analyze, get_nlp
+from Database import USER_COLLECTION, ensure_indexes
+from Persistence import bulk_upsert
+
+# ---------- Worker Process ----------
+# Each worker loads its own spaCy model once; pdfminer and spaCy then run
+# in parallel across all cores.
+def _init_worker():
+    get_nlp()
+
+def _analyze_one(item):
+    pdf_name, pdf_bytes = item
+    try:
+        analysis = analyze(pdf_bytes, pdf_name)
+    except Exception as e:
+        return {"pdf_name": pdf_name, "error": str(e)}
+    record = analysis.to_record()
+    record.update({
+        "pdf_name": pdf_name,
+        "source": "batch",
+        "timestamp": datetime.datetime.now().strftime('%Y-%m-%d_%H:%M:%S')
+    })
+    return record
+
+# ---------- Inputs ----------
+def _iter_zip(zf):
+    for info in zf.infolist():
+        if not info.is_dir() and info.filename.lower().endswith('.pdf'):
+            yield os.path.basename(info.filename), zf.read(info)
+
+def iter_paths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.lower().endswith(('.pdf', '.zip')):
+                        yield from iter_paths([os.path.join(root, name)])
+        elif path.lower().endswith('.zip'):
+            with zipfile.ZipFile(path) as zf:
+                yield from _iter_zip(zf)
+        elif path.lower().endswith('.pdf'):
+            with open(path, 'rb') as f:
+                yield os.path.basename(path), f.read()
+
+def iter_files(files):
+    for name, data in files:
+        if name.lower().endswith('.zip'):
+            with zipfile.ZipFile(io.BytesIO(data)) as zf:
+                yield from _iter_zip(zf)
+        else:
+            yield name, data
+
+def iter_uploads(uploaded_files):
+    for up in uploaded_files:
+        if up.name.lower().endswith('.zip'):
+            with zipfile.ZipFile(up) as zf:
+                yield from _iter_zip(zf)
+        else:
+            yield up.name, up.getvalue()
+
+# ---------- Batch Run ----------
+# Keeps at most `window` PDFs in flight so a large ZIP is never held in
+# memory all at once.
+def _bounded_map(pool, items, window):
+    in_flight = set()
+    for item in items:
+        in_flight.add(pool.submit(_analyze_one, item))
+        if len(in_flight) >= window:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+    for fut in in_flight:
+        yield fut.result()
+
+def run_batch(items, collection=None, workers=None, insert_size=200, on_progress=None):
+    workers = workers or os.cpu_count() or 1
+    analyzed = failed = 0
+    pending = []
+    errors = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for record in _bounded_map(pool, items, workers * 4):
+            if "error" in record:
+                failed += 1
+                errors.append(record)
+            else:
+                analyzed += 1
+                pending.append(record)
+            if collection is not None and len(pending) >= insert_size:
+                bulk_upsert(collection, pending)
+                pending = []
+            if on_progress:
+                on_progress(analyzed + failed)
+    if collection is not None and pending:
+        bulk_upsert(collection, pending)
+    seconds = time.perf_counter() - start
+    return {
+        "analyzed": analyzed,
+        "failed": failed,
+        "errors": errors,
+        "seconds": seconds,
+        "per_second": (analyzed + failed) / seconds if seconds else 0.0
+    }
+
+# ---------- CLI ----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze many resumes in parallel and store the results in MongoDB.")
+    parser.add_argument("paths", nargs="+", help="PDF files, ZIP archives or directories")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--insert-size", type=int, default=200, help="records per bulk write")
+    parser.add_argument("--mongo-uri", default=os.environ.get("MONGO_URI"))
+    parser.add_argument("--db", default="resume_analyzer")
+    parser.add_argument("--no-db", action="store_true", help="analyze only, do not write to MongoDB")
+    args = parser.parse_args(argv)
+
+    collection = None
+    if not args.no_db:
+        if not args.mongo_uri:
+            parser.error("--mongo-uri (or MONGO_URI) is required unless --no-db is given")
+        from pymongo import MongoClient
+        db = MongoClient(args.mongo_uri)[args.db]
+        # Upserts match on resume_hash; without its unique index each one
+        # scans the collection and concurrent writers can insert twice.
+        ensure_indexes(db)
+        collection = db[USER_COLLECTION]
+
+    stats = run_batch(iter_paths(args.paths), collection, args.workers, args.insert_size)
+    for err in stats["errors"]:
+        print(f"FAILED {err['pdf_name']}: {err['error']}")
+    print(f"Analyzed {stats['analyzed']} resumes ({stats['failed']} failed) in {stats['seconds']:.1f}s "
+          f"- {stats['per_second']:.2f} resumes/sec")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# ---------- Bounded LRU with optional on-disk tier ----------
+# Disk files are named by the SHA-256 of the key, so any key (e.g. one
+# containing "/") is a safe file name. Every hit refreshes the file's
+# mtime, and the disk tier evicts the oldest mtimes first, so both tiers
+# are least-recently-used.
+class ResultCache:
+    def __init__(self, max_items=128, disk_dir=None, max_disk_items=2048):
+        self.max_items = max_items
+        self.disk_dir = disk_dir
+        self.max_disk_items = max_disk_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, content_hash(key.encode("utf-8")) + ".pkl")
+
+    def _touch(self, key):
+        try:
+            os.utime(self._disk_path(key))
+        except OSError:
+            pass
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                value = self._items[key]
+                hit = True
+            else:
+                hit = False
+        if hit:
+            if self.disk_dir:
+                self._touch(key)
+            return value
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.PickleError, EOFError):
+                return default
+            self._touch(key)
+            self._remember(key, value)
+            return value
+        return default
+
+    def set(self, key, value):
+        self._remember(key, value)
+        if self.disk_dir:
+            tmp_path = self._disk_path(key) + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self._disk_path(key))
+            except (OSError, pickle.PickleError):
+                return
+            self._trim_disk()
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._items:
+                return True
+        return bool(self.disk_dir) and os.path.exists(self._disk_path(key))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def _trim_disk(self):
+        try:
+            entries = [e for e in os.scandir(self.disk_dir) if e.name.endswith(".pkl")]
+        except OSError:
+            return
+        if len(entries) <= self.max_disk_items:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_disk_items]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+# ---------- Bounded in-memory cache with expiry ----------
+class TTLCache:
+    def __init__(self, ttl=3600, max_items=1024):
+        self.ttl = ttl
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._items[key]
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def pop(self, key):
+        with self._lock:
+            entry = self._items.pop(key, None)
+        return entry[1] if entry else None
@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from Cache import TTLCache
+
+UNKNOWN_GEO = {"latlong": [0, 0], "city": "Unknown", "state": "Unknown", "country": "Unknown"}
+
+# ---------- Geo Resolvers ----------
+# A resolver is any callable taking an IP address (or "me") and returning a
+# dict shaped like UNKNOWN_GEO.
+def geocoder_resolver(ip):
+    import geocoder
+    g = geocoder.ip(ip)
+    return {
+        "latlong": g.latlng if g.latlng else [0, 0],
+        "city": getattr(g, 'city', '') or '',
+        "state": getattr(g, 'state', '') or '',
+        "country": getattr(g, 'country', '') or ''
+    }
+
+class StubResolver:
+    def __init__(self, result=None):
+        self.result = dict(result or UNKNOWN_GEO)
+        self.calls = []
+
+    def __call__(self, ip):
+        self.calls.append(ip)
+        return dict(self.result)
+
+RESOLVERS = {
+    "geocoder": geocoder_resolver,
+    "stub": StubResolver(),
+    "off": None
+}
+
+# ---------- Geo Lookup ----------
+# Lookups run on a small thread pool and are cached per IP, so page renders
+# never wait on the network; callers either peek with a short timeout or
+# attach a callback to enrich a record once the answer arrives.
+class GeoLookup:
+    def __init__(self, resolver=geocoder_resolver, ttl=6 * 3600, workers=2):
+        self.resolver = resolver
+        self.cache = TTLCache(ttl=ttl, max_items=10000)
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="geo")
+
+    def _resolve(self, ip):
+        try:
+            geo = self.resolver(ip)
+        except Exception:
+            geo = dict(UNKNOWN_GEO)
+        self.cache.set(ip, geo)
+        self._pending.pop(ip, None)
+        return geo
+
+    def lookup(self, ip="me"):
+        geo = self.cache.get(ip)
+        if geo is not None or self.resolver is None:
+            return None
+        future = self._pending.get(ip)
+        if future is None:
+            future = self._pending[ip] = self._executor.submit(self._resolve, ip)
+        return future
+
+    def get(self, ip="me", timeout=0.0):
+        geo = self.cache.get(ip)
+        if geo is not None:
+            return geo
+        future = self.lookup(ip)
+        if future is None:
+            return dict(UNKNOWN_GEO)
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            return None
+
+    def when_ready(self, ip, callback):
+        geo = self.cache.get(ip)
+        if geo is not None:
+            callback(geo)
+            return
+        future = self.lookup(ip)
+        if future is not None:
+            future.add_done_callback(lambda f: f.exception() is None and callback(f.result()))
@@ -1,57 +1,177 @@
-ds_course = [['Machine Learning Crash Course by Google [Free]', 'https://developers.google.com/machine-learning/crash-course'],
-             ['Machine Learning A-Z by Udemy','https://www.udemy.com/course/machinelearning/'],
-             ['Machine Learning by Andrew NG','https://www.coursera.org/learn/machine-learning'],
-             ['Data Scientist Master Program of Simplilearn (IBM)','https://www.simplilearn.com/big-data-and-analytics/senior-data-scientist-masters-program-training'],
-             ['Data Science Foundations: Fundamentals by LinkedIn','https://www.linkedin.com/learning/data-science-foundations-fundamentals-5'],
-             ['Data Scientist with Python','https://www.datacamp.com/tracks/data-scientist-with-python'],
-             ['Programming for Data Science with Python','https://www.udacity.com/course/programming-for-data-science-nanodegree--nd104'],
-             ['Programming for Data Science with R','https://www.udacity.com/course/programming-for-data-science-nanodegree-with-R--nd118'],
-             ['Introduction to Data Science','https://www.udacity.com/course/introduction-to-data-science--cd0017'],
-             ['Intro to Machine Learning with TensorFlow','https://www.udacity.com/course/intro-to-machine-learning-with-tensorflow-nanodegree--nd230']]
-
-web_course = [['Django Crash course [Free]','https://youtu.be/e1IyzVyrLSU'],
-              ['Python and Django Full Stack Web Developer Bootcamp','https://www.udemy.com/course/python-and-django-full-stack-web-developer-bootcamp'],
-              ['React Crash Course [Free]','https://youtu.be/Dorf8i6lCuk'],
-              ['ReactJS Project Development Training','https://www.dotnettricks.com/training/masters-program/reactjs-certification-training'],
-              ['Full Stack Web Developer - MEAN Stack','https://www.simplilearn.com/full-stack-web-developer-mean-stack-certification-training'],
-              ['Node.js and Express.js [Free]','https://youtu.be/Oe421EPjeBE'],
-              ['Flask: Develop Web Applications in Python','https://www.educative.io/courses/flask-develop-web-applications-in-python'],
-              ['Full Stack Web Developer by Udacity','https://www.udacity.com/course/full-stack-web-developer-nanodegree--nd0044'],
-              ['Front End Web Developer by Udacity','https://www.udacity.com/course/front-end-web-developer-nanodegree--nd0011'],
-              ['Become a React Developer by Udacity','https://www.udacity.com/course/react-nanodegree--nd019']]
-
-android_course = [['Android Development for Beginners [Free]','https://youtu.be/fis26HvvDII'],
-                  ['Android App Development Specialization','https://www.coursera.org/specializations/android-app-development'],
-                  ['Associate Android Developer Certification','https://grow.google/androiddev/#?modal_active=none'],
-                  ['Become an Android Kotlin Developer by Udacity','https://www.udacity.com/course/android-kotlin-developer-nanodegree--nd940'],
-                  ['Android Basics by Google','https://www.udacity.com/course/android-basics-nanodegree-by-google--nd803'],
-                  ['The Complete Android Developer Course','https://www.udemy.com/course/complete-android-n-developer-course/'],
-                  ['Building an Android App with Architecture Components','https://www.linkedin.com/learning/building-an-android-app-with-architecture-components'],
-                  ['Android App Development Masterclass using Kotlin','https://www.udemy.com/course/android-oreo-kotlin-app-masterclass/'],
-                  ['Flutter & Dart - The Complete Flutter App Development Course','https://www.udemy.com/course/flutter-dart-the-complete-flutter-app-development-course/'],
-                  ['Flutter App Development Course [Free]','https://youtu.be/rZLR5olMR64']]
-
-ios_course = [['IOS App Development by LinkedIn','https://www.linkedin.com/learning/subscription/topics/ios'],
-              ['iOS & Swift - The Complete iOS App Development Bootcamp','https://www.udemy.com/course/ios-13-app-development-bootcamp/'],
-              ['Become an iOS Developer','https://www.udacity.com/course/ios-developer-nanodegree--nd003'],
-              ['iOS App Development with Swift Specialization','https://www.coursera.org/specializations/app-development'],
-              ['Mobile App Development with Swift','https://www.edx.org/professional-certificate/curtinx-mobile-app-development-with-swift'],
-              ['Swift Course by LinkedIn','https://www.linkedin.com/learning/subscription/topics/swift-2'],
-              ['Objective-C Crash Course for Swift Developers','https://www.udemy.com/course/objectivec/'],
-              ['Learn Swift by Codecademy','https://www.codecademy.com/learn/learn-swift'],
-              ['Swift Tutorial - Full Course for Beginners [Free]','https://youtu.be/comQ1-x2a1Q'],
-              ['Learn Swift Fast - [Free]','https://youtu.be/FcsY1YPBwzQ']]
-
-uiux_course = [['Google UX Design Professional Certificate','https://www.coursera.org/professional-certificates/google-ux-design'],
-               ['UI / UX Design Specialization','https://www.coursera.org/specializations/ui-ux-design'],
-               ['The Complete App Design Course - UX, UI and Design Thinking','https://www.udemy.com/course/the-complete-app-design-course-ux-and-ui-design/'],
-               ['UX & Web Design Master Course: Strategy, Design, Development','https://www.udemy.com/course/ux-web-design-master-course-strategy-design-development/'],
-               ['The Complete App Design Course - UX, UI and Design Thinking','https://www.udemy.com/course/the-complete-app-design-course-ux-and-ui-design/'],
-               ['DESIGN RULES: Principles + Practices for Great UI Design','https://www.udemy.com/course/design-rules/'],
-               ['Become a UX Designer by Udacity','https://www.udacity.com/course/ux-designer-nanodegree--nd578'],
-               ['Adobe XD Tutorial: User Experience Design Course [Free]','https://youtu.be/68w2VwalD5w'],
-               ['Adobe XD for Beginners [Free]','https://youtu.be/WEljsc2jorI'],
-               ['Adobe XD in Simple Way','https://learnux.io/course/adobe-xd']]
+import functools
+from dataclasses import dataclass
+from typing import Tuple
+
+from Taxonomy import normalize
+
+@dataclass(frozen=True)
+class Course:
+    title: str
+    url: str
+    field: str
+    skills: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()
+
+    @property
+    def free(self):
+        return "free" in self.tags
+
+COURSES = [
+    # ---- Data Science ----
+    Course('Machine Learning Crash Course by Google [Free]', 'https://developers.google.com/machine-learning/crash-course', "Data Science",
+           ("machine learning", "tensorflow", "feature engineering"), ("free", "google", "beginner")),
+    Course('Machine Learning A-Z by Udemy', 'https://www.udemy.com/course/machinelearning/', "Data Science",
+           ("machine learning", "python", "scikit-learn", "deep learning", "nlp"), ("udemy",)),
+    Course('Machine Learning by Andrew NG', 'https://www.coursera.org/learn/machine-learning', "Data Science",
+           ("machine learning", "supervised learning", "neural networks"), ("coursera", "beginner")),
+    Course('Data Scientist Master Program of Simplilearn (IBM)', 'https://www.simplilearn.com/big-data-and-analytics/senior-data-scientist-masters-program-training', "Data Science",
+           ("machine learning", "python", "sql", "deep learning", "model deployment"), ("simplilearn", "ibm", "certification")),
+    Course('Data Science Foundations: Fundamentals by LinkedIn', 'https://www.linkedin.com/learning/data-science-foundations-fundamentals-5', "Data Science",
+           ("data analysis", "statistics"), ("linkedin", "beginner")),
+    Course('Data Scientist with Python', 'https://www.datacamp.com/tracks/data-scientist-with-python', "Data Science",
+           ("python", "pandas", "numpy", "scikit-learn", "feature engineering"), ("datacamp",)),
+    Course('Programming for Data Science with Python', 'https://www.udacity.com/course/programming-for-data-science-nanodegree--nd104', "Data Science",
+           ("python", "sql", "pandas", "numpy"), ("udacity", "nanodegree", "beginner")),
+    Course('Programming for Data Science with R', 'https://www.udacity.com/course/programming-for-data-science-nanodegree-with-R--nd118', "Data Science",
+           ("r", "sql", "statistics"), ("udacity", "nanodegree", "beginner")),
+    Course('Introduction to Data Science', 'https://www.udacity.com/course/introduction-to-data-science--cd0017', "Data Science",
+           ("data analysis", "statistics", "data wrangling"), ("udacity", "beginner")),
+    Course('Intro to Machine Learning with TensorFlow', 'https://www.udacity.com/course/intro-to-machine-learning-with-tensorflow-nanodegree--nd230', "Data Science",
+           ("machine learning", "tensorflow", "deep learning", "neural networks"), ("udacity", "nanodegree")),
+
+    # ---- Web Development ----
+    Course('Django Crash course [Free]', 'https://youtu.be/e1IyzVyrLSU', "Web Development",
+           ("django", "python"), ("free", "youtube", "beginner")),
+    Course('Python and Django Full Stack Web Developer Bootcamp', 'https://www.udemy.com/course/python-and-django-full-stack-web-developer-bootcamp', "Web Development",
+           ("django", "python", "html", "css", "javascript"), ("udemy", "full stack")),
+    Course('React Crash Course [Free]', 'https://youtu.be/Dorf8i6lCuk', "Web Development",
+           ("react", "javascript"), ("free", "youtube", "beginner")),
+    Course('ReactJS Project Development Training', 'https://www.dotnettricks.com/training/masters-program/reactjs-certification-training', "Web Development",
+           ("react", "redux", "javascript"), ("dotnettricks", "certification")),
+    Course('Full Stack Web Developer - MEAN Stack', 'https://www.simplilearn.com/full-stack-web-developer-mean-stack-certification-training', "Web Development",
+           ("mongodb", "express", "angular", "node.js", "advanced backend architecture"), ("simplilearn", "full stack", "certification")),
+    Course('Node.js and Express.js [Free]', 'https://youtu.be/Oe421EPjeBE', "Web Development",
+           ("node.js", "express", "rest api"), ("free", "youtube")),
+    Course('Flask: Develop Web Applications in Python', 'https://www.educative.io/courses/flask-develop-web-applications-in-python', "Web Development",
+           ("flask", "python"), ("educative",)),
+    Course('Full Stack Web Developer by Udacity', 'https://www.udacity.com/course/full-stack-web-developer-nanodegree--nd0044', "Web Development",
+           ("sql", "rest api", "docker", "ci/cd", "system design", "advanced backend architecture"), ("udacity", "nanodegree", "full stack")),
+    Course('Front End Web Developer by Udacity', 'https://www.udacity.com/course/front-end-web-developer-nanodegree--nd0011', "Web Development",
+           ("html", "css", "javascript"), ("udacity", "nanodegree", "frontend")),
+    Course('Become a React Developer by Udacity', 'https://www.udacity.com/course/react-nanodegree--nd019', "Web Development",
+           ("react", "redux", "javascript"), ("udacity", "nanodegree", "frontend")),
+
+    # ---- Android Development ----
+    Course('Android Development for Beginners [Free]', 'https://youtu.be/fis26HvvDII', "Android Development",
+           ("android", "java"), ("free", "youtube", "beginner")),
+    Course('Android App Development Specialization', 'https://www.coursera.org/specializations/android-app-development', "Android Development",
+           ("android", "java"), ("coursera", "specialization")),
+    Course('Associate Android Developer Certification', 'https://grow.google/androiddev/#?modal_active=none', "Android Development",
+           ("android", "kotlin", "jetpack compose"), ("google", "certification")),
+    Course('Become an Android Kotlin Developer by Udacity', 'https://www.udacity.com/course/android-kotlin-developer-nanodegree--nd940', "Android Development",
+           ("kotlin", "android", "firebase", "mvvm architecture"), ("udacity", "nanodegree")),
+    Course('Android Basics by Google', 'https://www.udacity.com/course/android-basics-nanodegree-by-google--nd803', "Android Development",
+           ("android", "java", "xml"), ("udacity", "google", "beginner")),
+    Course('The Complete Android Developer Course', 'https://www.udemy.com/course/complete-android-n-developer-course/', "Android Development",
+           ("android", "java", "firebase"), ("udemy",)),
+    Course('Building an Android App with Architecture Components', 'https://www.linkedin.com/learning/building-an-android-app-with-architecture-components', "Android Development",
+           ("android", "mvvm architecture", "jetpack compose"), ("linkedin",)),
+    Course('Android App Development Masterclass using Kotlin', 'https://www.udemy.com/course/android-oreo-kotlin-app-masterclass/', "Android Development",
+           ("kotlin", "android"), ("udemy",)),
+    Course('Flutter & Dart - The Complete Flutter App Development Course', 'https://www.udemy.com/course/flutter-dart-the-complete-flutter-app-development-course/', "Android Development",
+           ("flutter", "dart", "firebase"), ("udemy", "cross platform")),
+    Course('Flutter App Development Course [Free]', 'https://youtu.be/rZLR5olMR64', "Android Development",
+           ("flutter", "dart"), ("free", "youtube", "cross platform", "beginner")),
+
+    # ---- IOS Development ----
+    Course('IOS App Development by LinkedIn', 'https://www.linkedin.com/learning/subscription/topics/ios', "IOS Development",
+           ("ios", "swift", "xcode"), ("linkedin",)),
+    Course('iOS & Swift - The Complete iOS App Development Bootcamp', 'https://www.udemy.com/course/ios-13-app-development-bootcamp/', "IOS Development",
+           ("ios", "swift", "swiftui", "coredata", "app store deployment"), ("udemy", "bootcamp")),
+    Course('Become an iOS Developer', 'https://www.udacity.com/course/ios-developer-nanodegree--nd003', "IOS Development",
+           ("ios", "swift", "coredata", "app store deployment"), ("udacity", "nanodegree")),
+    Course('iOS App Development with Swift Specialization', 'https://www.coursera.org/specializations/app-development', "IOS Development",
+           ("ios", "swift", "xcode"), ("coursera", "specialization")),
+    Course('Mobile App Development with Swift', 'https://www.edx.org/professional-certificate/curtinx-mobile-app-development-with-swift', "IOS Development",
+           ("swift", "ios", "xcode"), ("edx", "certification")),
+    Course('Swift Course by LinkedIn', 'https://www.linkedin.com/learning/subscription/topics/swift-2', "IOS Development",
+           ("swift",), ("linkedin",)),
+    Course('Objective-C Crash Course for Swift Developers', 'https://www.udemy.com/course/objectivec/', "IOS Development",
+           ("objective-c", "cocoa touch"), ("udemy",)),
+    Course('Learn Swift by Codecademy', 'https://www.codecademy.com/learn/learn-swift', "IOS Development",
+           ("swift",), ("codecademy", "beginner")),
+    Course('Swift Tutorial - Full Course for Beginners [Free]', 'https://youtu.be/comQ1-x2a1Q', "IOS Development",
+           ("swift", "swiftui"), ("free", "youtube", "beginner")),
+    Course('Learn Swift Fast - [Free]', 'https://youtu.be/FcsY1YPBwzQ', "IOS Development",
+           ("swift",), ("free", "youtube", "beginner")),
+
+    # ---- UI-UX Development ----
+    Course('Google UX Design Professional Certificate', 'https://www.coursera.org/professional-certificates/google-ux-design', "UI-UX Development",
+           ("user research", "wireframes", "prototyping", "figma", "user experience"), ("coursera", "google", "certification", "beginner")),
+    Course('UI / UX Design Specialization', 'https://www.coursera.org/specializations/ui-ux-design', "UI-UX Development",
+           ("interaction design", "design systems", "wireframes"), ("coursera", "specialization")),
+    Course('The Complete App Design Course - UX, UI and Design Thinking', 'https://www.udemy.com/course/the-complete-app-design-course-ux-and-ui-design/', "UI-UX Development",
+           ("design thinking", "prototyping", "adobe xd", "user experience"), ("udemy",)),
+    Course('UX & Web Design Master Course: Strategy, Design, Development', 'https://www.udemy.com/course/ux-web-design-master-course-strategy-design-development/', "UI-UX Development",
+           ("user research", "interaction design", "figma"), ("udemy",)),
+    Course('DESIGN RULES: Principles + Practices for Great UI Design', 'https://www.udemy.com/course/design-rules/', "UI-UX Development",
+           ("design systems", "visual design"), ("udemy",)),
+    Course('Become a UX Designer by Udacity', 'https://www.udacity.com/course/ux-designer-nanodegree--nd578', "UI-UX Development",
+           ("user research", "prototyping", "interaction design"), ("udacity", "nanodegree")),
+    Course('Adobe XD Tutorial: User Experience Design Course [Free]', 'https://youtu.be/68w2VwalD5w', "UI-UX Development",
+           ("adobe xd", "prototyping", "user experience"), ("free", "youtube")),
+    Course('Adobe XD for Beginners [Free]', 'https://youtu.be/WEljsc2jorI', "UI-UX Development",
+           ("adobe xd", "wireframes"), ("free", "youtube", "beginner")),
+    Course('Adobe XD in Simple Way', 'https://learnux.io/course/adobe-xd', "UI-UX Development",
+           ("adobe xd", "prototyping"), ("learnux",)),
+]
+
+# ---------- Course Catalog ----------
+# Skills and tags map to course positions through an inverted index built
+# once. Courses are ranked by how many of the wanted skills they teach
+# (whole-term hits count double, shared words once), then by fewer skills
+# the candidate already has, then by catalog order, so the same request
+# always gets the same list.
+class CourseCatalog:
+    def __init__(self, courses):
+        self.courses = list(courses)
+        self.by_field = {}
+        self.by_term = {}
+        self.by_word = {}
+        for pos, course in enumerate(self.courses):
+            self.by_field.setdefault(course.field, []).append(pos)
+            for term in course.skills + course.tags:
+                term = normalize(term)
+                self.by_term.setdefault(term, set()).add(pos)
+                for word in term.split():
+                    self.by_word.setdefault(word, set()).add(pos)
+
+    def fields(self):
+        return list(self.by_field)
+
+    def _hits(self, skills):
+        hits = {}
+        for skill in skills:
+            term = normalize(skill)
+            for pos in self.by_term.get(term, ()):
+                hits[pos] = hits.get(pos, 0) + 2
+            for pos in set().union(*(self.by_word.get(w, set()) for w in term.split())) - self.by_term.get(term, set()):
+                hits[pos] = hits.get(pos, 0) + 1
+        return hits
+
+    @functools.lru_cache(maxsize=1024)
+    def _ranked(self, field, wanted, have):
+        gain, overlap = self._hits(wanted), self._hits(have)
+        order = sorted(self.by_field.get(field, []), key=lambda pos: (-gain.get(pos, 0), overlap.get(pos, 0), pos))
+        return tuple(self.courses[pos] for pos in order)
+
+    # `wanted` are the skills to learn; `have` the ones already on the resume.
+    def recommend(self, field, wanted=(), have=(), n=5):
+        have_set = {normalize(s) for s in have}
+        wanted = tuple(sorted({normalize(s) for s in wanted} - have_set))
+        return list(self._ranked(field, wanted, tuple(sorted(have_set)))[:n])
+
+catalog = CourseCatalog(COURSES)
 
 resume_videos = [ 'https://youtu.be/Tt08KmFfIYQ','https://youtu.be/y8YH0Qbu5h4',
                   'https://youtu.be/u75hUSShvnc','https://youtu.be/BYUy1yvjHxE',
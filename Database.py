@@ -0,0 +1,91 @@
+import csv
+import io
+import math
+
+# ---------- Collections & Indexes ----------
+USER_COLLECTION = "user_data"
+FEEDBACK_COLLECTION = "user_feedback"
+
+USER_INDEXES = ["timestamp", "predicted_field", "user_level", "resume_score"]
+FEEDBACK_INDEXES = ["timestamp", "feed_score"]
+
+# Columns shown in the Admin table and written to the CSV export.
+USER_FIELDS = ["act_name", "act_mail", "act_mob", "candidate_name", "candidate_email",
+               "resume_score", "total_pages", "predicted_field", "user_level",
+               "actual_skills", "recommended_skills", "recommended_courses", "pdf_name", "timestamp"]
+FEEDBACK_FIELDS = ["feed_name", "feed_email", "feed_score", "comments", "timestamp"]
+# Columns shown next to candidate search hits.
+SEARCH_FIELDS = ["candidate_name", "candidate_email", "predicted_field", "user_level",
+                 "resume_score", "actual_skills", "timestamp"]
+
+def ensure_indexes(db):
+    for field in USER_INDEXES:
+        db[USER_COLLECTION].create_index(field)
+    # Analyses are upserted on the resume content hash; older records
+    # without one are left out of the unique index.
+    db[USER_COLLECTION].create_index("resume_hash", unique=True, sparse=True)
+    for field in FEEDBACK_INDEXES:
+        db[FEEDBACK_COLLECTION].create_index(field)
+
+def projection(fields):
+    proj = {field: 1 for field in fields}
+    proj["_id"] = 0
+    return proj
+
+# ---------- Queries ----------
+# Filtering, sorting and paging all run inside MongoDB; only one page of
+# projected documents ever reaches the app.
+def build_filter(predicted_field=None, user_level=None, min_score=None, since=None):
+    query = {}
+    if predicted_field:
+        query["predicted_field"] = predicted_field
+    if user_level:
+        query["user_level"] = user_level
+    if min_score is not None:
+        query["resume_score"] = {"$gte": min_score}
+    if since:
+        query["timestamp"] = {"$gte": since}
+    return query
+
+def fetch_page(collection, query=None, fields=USER_FIELDS, sort_field="timestamp", descending=True,
+               page=1, page_size=50):
+    query = query or {}
+    total = collection.count_documents(query)
+    pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, page), pages)
+    cursor = (collection.find(query, projection(fields))
+              .sort(sort_field, -1 if descending else 1)
+              .skip((page - 1) * page_size)
+              .limit(page_size))
+    return list(cursor), total, pages
+
+def distinct_values(collection, field):
+    return sorted(v for v in collection.distinct(field) if v is not None)
+
+# ---------- CSV Export ----------
+def _cell(value):
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return value
+
+def iter_csv(collection, query=None, fields=USER_FIELDS, sort_field="timestamp", chunk_size=1000):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(fields)
+    cursor = collection.find(query or {}, projection(fields)).sort(sort_field, 1).batch_size(chunk_size)
+    rows = 0
+    for doc in cursor:
+        writer.writerow([_cell(doc.get(field)) for field in fields])
+        rows += 1
+        if rows % chunk_size == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+    if buf.tell():
+        yield buf.getvalue()
+
+def export_csv(collection, fh, query=None, fields=USER_FIELDS, chunk_size=1000):
+    for chunk in iter_csv(collection, query, fields, chunk_size=chunk_size):
+        fh.write(chunk.encode("utf-8"))
+    fh.seek(0)
+    return fh
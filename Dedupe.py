@@ -0,0 +1,110 @@
+import base64
+import os
+import re
+import threading
+import zlib
+
+import numpy as np
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+NUM_PERM = 128
+SEED = 1
+# Texts with fewer shingles than this (blank scans, one-line pages) carry
+# too little signal to compare and are never treated as duplicates.
+MIN_SHINGLES = 10
+
+# ---------- MinHash ----------
+# Word k-shingles are hashed to 32 bits and pushed through NUM_PERM
+# multiply-shift hash functions; the signature keeps each function's minimum.
+# The fraction of equal positions in two signatures estimates the Jaccard
+# similarity of the shingle sets.
+_rng = np.random.default_rng(SEED)
+_A = _rng.integers(1, 2 ** 63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64)
+
+def shingles(text, k=3):
+    words = np.fromiter((zlib.crc32(w.encode("utf-8")) for w in TOKEN_RE.findall(text.lower())), dtype=np.uint64)
+    if len(words) < k:
+        return np.unique(words)
+    window = np.lib.stride_tricks.sliding_window_view(words, k)
+    mix = np.uint64(0x9E3779B97F4A7C15) ** np.arange(k, dtype=np.uint64)
+    return np.unique((window * mix).sum(axis=1, dtype=np.uint64) >> np.uint64(32))
+
+def signature(text, k=3):
+    hashed = shingles(text, k)
+    if not len(hashed):
+        return np.full(NUM_PERM, np.iinfo(np.uint32).max, dtype=np.uint32)
+    return ((hashed[:, None] * _A + _B) >> np.uint64(32)).min(axis=0).astype(np.uint32)
+
+def similarity(sig_a, sig_b):
+    return float(np.mean(sig_a == sig_b))
+
+# ---------- LSH Index ----------
+# Signatures are cut into `bands` bands of NUM_PERM / bands rows; documents
+# sharing any band bucket are candidates and are confirmed against the full
+# signature. Additions are appended to a log file so the index survives
+# restarts and is rebuilt by replaying it.
+class DuplicateIndex:
+    def __init__(self, path=None, threshold=0.8, bands=32):
+        self.path = path
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self._replay()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._signatures)
+
+    def _band_keys(self, sig):
+        return [sig[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _insert(self, key, sig):
+        self._signatures[key] = sig
+        for bucket, band in zip(self._buckets, self._band_keys(sig)):
+            bucket.setdefault(band, []).append(key)
+
+    def _replay(self):
+        with open(self.path, "r", encoding="ascii") as f:
+            for line in f:
+                key, _, encoded = line.strip().partition("\t")
+                try:
+                    sig = np.frombuffer(base64.b64decode(encoded), dtype=np.uint32)
+                except ValueError:
+                    continue
+                if len(sig) == NUM_PERM and key not in self._signatures:
+                    self._insert(key, sig)
+
+    def query(self, sig):
+        with self._lock:
+            candidates = set()
+            for bucket, band in zip(self._buckets, self._band_keys(sig)):
+                candidates.update(bucket.get(band, ()))
+            scored = [(similarity(sig, self._signatures[key]), key) for key in candidates]
+        best = max(scored, default=None)
+        return (best[1], best[0]) if best and best[0] >= self.threshold else (None, 0.0)
+
+    def add(self, key, sig):
+        with self._lock:
+            if key in self._signatures:
+                return
+            self._insert(key, sig)
+            if self.path:
+                with open(self.path, "a", encoding="ascii") as f:
+                    f.write(f"{key}\t{base64.b64encode(sig.tobytes()).decode('ascii')}\n")
+
+    # Returns the key of an earlier near-duplicate, or registers `key` and
+    # returns it when none is similar enough or the text is too short.
+    def canonical(self, key, text):
+        if len(shingles(text)) < MIN_SHINGLES:
+            return key
+        sig = signature(text)
+        match, _ = self.query(sig)
+        if match is not None:
+            return match
+        self.add(key, sig)
+        return key
@@ -0,0 +1,154 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from Ocr import ocr_fallback
+
+# Long CVs are split into contiguous page ranges and extracted in parallel
+# once they have at least this many pages.
+PARALLEL_MIN_PAGES = 6
+
+_pool = None
+
+def _get_pool(workers=None):
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1))
+    return _pool
+
+def _open(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source), True
+    if isinstance(source, str):
+        return open(source, 'rb'), True
+    return source, False
+
+# Without layout analysis pdfminer hands over bare characters with no line
+# breaks; this converter writes one wherever the baseline moves, so names,
+# emails and headings on separate lines stay apart.
+_line_converter = None
+
+def _line_converter_class():
+    global _line_converter
+    if _line_converter is None:
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LTChar, LTContainer, LTText
+
+        class LineTextConverter(TextConverter):
+            def receive_layout(self, ltpage):
+                last = None
+
+                def render(item):
+                    nonlocal last
+                    if isinstance(item, LTContainer):
+                        for child in item:
+                            render(child)
+                    elif isinstance(item, LTText):
+                        if isinstance(item, LTChar):
+                            if last is not None and abs(item.y0 - last.y0) > min(item.height, last.height) / 2:
+                                self.write_text("\n")
+                            last = item
+                        self.write_text(item.get_text())
+
+                render(ltpage)
+                self.write_text("\n\f")
+
+        _line_converter = LineTextConverter
+    return _line_converter
+
+# ---------- Page Stream ----------
+# Works straight off the in-memory upload; yields each page's text as soon
+# as it is interpreted. `fast` skips pdfminer's layout analysis, which is
+# most of the per-page cost but can merge columns less cleanly; line breaks
+# are kept either way.
+def iter_pages(source, fast=False, pagenos=None):
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.converter import TextConverter
+
+    fh, owned = _open(source)
+    resource_manager = PDFResourceManager()
+    page_text = io.StringIO()
+    if fast:
+        converter = _line_converter_class()(resource_manager, page_text, laparams=None)
+    else:
+        converter = TextConverter(resource_manager, page_text, laparams=LAParams())
+    page_interpreter = PDFPageInterpreter(resource_manager, converter)
+    try:
+        for page in PDFPage.get_pages(fh, pagenos=pagenos, caching=False, check_extractable=True):
+            page_interpreter.process_page(page)
+            text = page_text.getvalue()
+            page_text.seek(0)
+            page_text.truncate(0)
+            yield text
+    finally:
+        converter.close()
+        page_text.close()
+        if owned:
+            fh.close()
+
+def count_pages(source):
+    from pdfminer.pdfparser import PDFParser
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdftypes import resolve1
+
+    fh, owned = _open(source)
+    try:
+        document = PDFDocument(PDFParser(fh))
+        return int(resolve1(document.catalog['Pages'])['Count'])
+    except Exception:
+        return 0
+    finally:
+        if owned:
+            fh.close()
+
+def _extract_range(args):
+    pdf_bytes, start, stop, fast = args
+    return list(iter_pages(pdf_bytes, fast, set(range(start, stop))))
+
+# ---------- Extraction ----------
+# With `ocr`, pages that yield almost no text (scanned images) are
+# rasterized and OCRed; see Ocr.ocr_fallback.
+def extract_pages(source, max_pages=None, max_chars=None, fast=False, parallel=False, workers=None, ocr=False):
+    if ocr and isinstance(source, (bytes, bytearray)):
+        pages = extract_pages(source, max_pages, None, fast, parallel, workers)
+        return _cut(ocr_fallback(source, pages), max_chars)
+    if parallel and isinstance(source, (bytes, bytearray)):
+        total = count_pages(source)
+        if max_pages:
+            total = min(total, max_pages)
+        if total >= PARALLEL_MIN_PAGES:
+            pool = _get_pool(workers)
+            n_chunks = min(pool._max_workers, total)
+            bounds = [total * i // n_chunks for i in range(n_chunks + 1)]
+            jobs = [(bytes(source), bounds[i], bounds[i + 1], fast) for i in range(n_chunks)]
+            pages = [text for chunk in pool.map(_extract_range, jobs) for text in chunk]
+            return _cut(pages, max_chars)
+
+    pages = []
+    n_chars = 0
+    for text in iter_pages(source, fast):
+        pages.append(text)
+        n_chars += len(text)
+        if (max_pages and len(pages) >= max_pages) or (max_chars and n_chars >= max_chars):
+            break
+    return _cut(pages, max_chars)
+
+def _cut(pages, max_chars):
+    if not max_chars:
+        return pages
+    kept, n_chars = [], 0
+    for text in pages:
+        if n_chars + len(text) >= max_chars:
+            kept.append(text[:max_chars - n_chars])
+            break
+        kept.append(text)
+        n_chars += len(text)
+    return kept
+
+def extract_text(source, **kwargs):
+    return ''.join(extract_pages(source, **kwargs))
+
+def pdf_reader(file):
+    return extract_text(file)
@@ -0,0 +1,152 @@
+import datetime
+import hashlib
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Cache import TTLCache
+
+DEFAULT_MODEL = "gemini-2.5-flash"
+RETRYABLE_CODES = {429, 500, 502, 503, 504}
+
+
+class GeminiUnavailable(Exception):
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code
+
+    @property
+    def quota_exceeded(self):
+        return self.code == 429
+
+
+def prompt_key(prompt, model):
+    return hashlib.sha256((model + "\0" + prompt).encode("utf-8")).hexdigest()
+
+
+def _error_code(e):
+    code = getattr(e, "code", None)
+    if code is None:
+        code = getattr(e, "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+# ---------- Prompts ----------
+# Shared by the Streamlit app and the API so both cache the same replies.
+def pitch_prompt(analysis):
+    return f"Summarize this resume into a 2-line professional pitch: {analysis.resume_text[:2500]}"
+
+
+# ---------- Client ----------
+# Wraps google-genai with a prompt-hash cache (in-memory TTL plus an optional
+# MongoDB collection), per-request timeouts, exponential backoff on 429/5xx
+# and a cap on concurrent in-flight requests.
+class GeminiClient:
+    def __init__(self, api_key, model=DEFAULT_MODEL, timeout=30, max_retries=4,
+                 backoff=1.0, max_concurrency=4, cache_ttl=6 * 3600, cache_collection=None, client=None):
+        self.model = model
+        self.max_retries = max_retries
+        self.backoff = backoff
+        if client is None:
+            from google import genai
+            from google.genai import types
+            client = genai.Client(api_key=api_key, http_options=types.HttpOptions(timeout=int(timeout * 1000)))
+        self.client = client
+        self.cache = TTLCache(ttl=cache_ttl)
+        self.cache_ttl = cache_ttl
+        self.cache_collection = cache_collection
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="gemini")
+        if cache_collection is not None:
+            try:
+                cache_collection.create_index("created_at", expireAfterSeconds=int(cache_ttl))
+            except Exception:
+                pass
+
+    # ---- Cache tiers ----
+    def cached(self, prompt):
+        key = prompt_key(prompt, self.model)
+        text = self.cache.get(key)
+        if text is None and self.cache_collection is not None:
+            try:
+                doc = self.cache_collection.find_one({"_id": key}, {"response": 1})
+            except Exception:
+                doc = None
+            if doc:
+                text = doc["response"]
+                self.cache.set(key, text)
+        return text
+
+    def _store(self, prompt, text):
+        if not text:
+            return
+        key = prompt_key(prompt, self.model)
+        self.cache.set(key, text)
+        if self.cache_collection is not None:
+            try:
+                self.cache_collection.replace_one(
+                    {"_id": key},
+                    {"_id": key, "model": self.model, "response": text,
+                     "created_at": datetime.datetime.now(datetime.timezone.utc)},
+                    upsert=True
+                )
+            except Exception:
+                pass
+
+    # ---- Calls ----
+    def _with_retries(self, call):
+        attempt = 0
+        while True:
+            try:
+                with self._slots:
+                    return call()
+            except Exception as e:
+                code = _error_code(e)
+                if code not in RETRYABLE_CODES or attempt >= self.max_retries:
+                    raise GeminiUnavailable(str(e), code) from e
+                delay = self.backoff * (2 ** attempt)
+                time.sleep(delay + random.uniform(0, delay / 2))
+                attempt += 1
+
+    def generate(self, prompt):
+        text = self.cached(prompt)
+        if text is not None:
+            return text
+        response = self._with_retries(lambda: self.client.models.generate_content(model=self.model, contents=prompt))
+        text = (response.text or "").strip()
+        self._store(prompt, text)
+        return text
+
+    def submit(self, prompt):
+        return self._executor.submit(self.generate, prompt)
+
+    def generate_many(self, prompts):
+        futures = [self.submit(p) for p in prompts]
+        return [f.result() for f in futures]
+
+    def stream(self, prompt):
+        text = self.cached(prompt)
+        if text is not None:
+            yield text
+            return
+        # Retries only cover the request up to the first chunk; once text
+        # has been yielded a failure is surfaced to the caller.
+        def open_stream():
+            chunks = iter(self.client.models.generate_content_stream(model=self.model, contents=prompt))
+            return next(chunks, None), chunks
+
+        first, chunks = self._with_retries(open_stream)
+        if first is not None:
+            chunks = itertools.chain([first], chunks)
+        parts = []
+        try:
+            with self._slots:
+                for chunk in chunks:
+                    if chunk.text:
+                        parts.append(chunk.text)
+                        yield chunk.text
+        except Exception as e:
+            raise GeminiUnavailable(str(e), _error_code(e)) from e
+        self._store(prompt, "".join(parts).strip())
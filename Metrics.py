@@ -0,0 +1,144 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger("resume_analyzer.metrics")
+
+# Latency histogram buckets in seconds.
+BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+
+# ---------- Registry ----------
+class Registry:
+    def __init__(self, recent=200):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self.recent = deque(maxlen=recent)
+
+    def observe(self, stage, wall, cpu=0.0, peak=0):
+        with self._lock:
+            s = self._stages.get(stage)
+            if s is None:
+                s = self._stages[stage] = {"count": 0, "wall": 0.0, "cpu": 0.0, "peak": 0,
+                                           "buckets": [0] * len(BUCKETS)}
+            s["count"] += 1
+            s["wall"] += wall
+            s["cpu"] += cpu
+            s["peak"] = max(s["peak"], peak)
+            for i, bound in enumerate(BUCKETS):
+                if wall <= bound:
+                    s["buckets"][i] += 1
+
+    def record(self, entry):
+        with self._lock:
+            self.recent.append(entry)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: dict(s, buckets=list(s["buckets"])) for name, s in self._stages.items()}
+
+    def recent_entries(self):
+        with self._lock:
+            return list(self.recent)
+
+    def render_prometheus(self):
+        lines = [
+            "# HELP resume_stage_seconds Wall time per analysis stage.",
+            "# TYPE resume_stage_seconds histogram",
+        ]
+        stages = self.snapshot()
+        for name, s in sorted(stages.items()):
+            for bound, count in zip(BUCKETS, s["buckets"]):
+                lines.append(f'resume_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {count}')
+            lines.append(f'resume_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {s["count"]}')
+            lines.append(f'resume_stage_seconds_sum{{stage="{name}"}} {s["wall"]:.6f}')
+            lines.append(f'resume_stage_seconds_count{{stage="{name}"}} {s["count"]}')
+        lines += ["# HELP resume_stage_cpu_seconds_total CPU time per analysis stage.",
+                  "# TYPE resume_stage_cpu_seconds_total counter"]
+        for name, s in sorted(stages.items()):
+            lines.append(f'resume_stage_cpu_seconds_total{{stage="{name}"}} {s["cpu"]:.6f}')
+        lines += ["# HELP resume_stage_peak_bytes Largest tracemalloc peak seen per stage.",
+                  "# TYPE resume_stage_peak_bytes gauge"]
+        for name, s in sorted(stages.items()):
+            lines.append(f'resume_stage_peak_bytes{{stage="{name}"}} {s["peak"]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+REGISTRY = Registry()
+
+# ---------- Per-analysis Timing ----------
+# Wall time, CPU time of the calling thread and, when tracemalloc is running,
+# the allocation peak of each stage. One log line per analysis.
+class StageTimer:
+    def __init__(self, registry=REGISTRY, **context):
+        self.registry = registry
+        self.context = context
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        wall0, cpu0 = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall0
+            cpu = time.thread_time() - cpu0
+            peak = tracemalloc.get_traced_memory()[1] if tracing else 0
+            self.stages[name] = {"wall_ms": round(wall * 1000, 3), "cpu_ms": round(cpu * 1000, 3), "peak_kb": peak // 1024}
+            self.registry.observe(name, wall, cpu, peak)
+
+    def finish(self):
+        entry = dict(self.context, ts=time.time(), stages=self.stages,
+                     total_ms=round(sum(s["wall_ms"] for s in self.stages.values()), 3))
+        self.registry.record(entry)
+        logger.info(json.dumps(entry))
+        return entry
+
+def observe(stage, wall, cpu=0.0):
+    REGISTRY.observe(stage, wall, cpu)
+
+# ---------- Sampled Profiling ----------
+# Profiles roughly `rate` of the wrapped calls with pyinstrument when it is
+# installed, otherwise cProfile, and writes the result to `out_dir`.
+@contextmanager
+def maybe_profile(name, rate=0.0, out_dir="./profiles"):
+    if rate <= 0 or random.random() >= rate:
+        yield
+        return
+    os.makedirs(out_dir, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        Profiler = None
+    if Profiler is not None:
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            with open(os.path.join(out_dir, f"{name}-{stamp}.html"), "w") as f:
+                f.write(profiler.output_html())
+    else:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(os.path.join(out_dir, f"{name}-{stamp}.prof"))
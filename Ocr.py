@@ -0,0 +1,124 @@
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from Cache import ResultCache, content_hash
+
+logger = logging.getLogger("resume_analyzer.ocr")
+
+# Pages with fewer non-blank characters than this are treated as scanned.
+MIN_CHARS = int(os.environ.get("OCR_MIN_CHARS", 40))
+DPI = int(os.environ.get("OCR_DPI", 200))
+MAX_PAGES = int(os.environ.get("OCR_MAX_PAGES", 5))
+PAGE_TIMEOUT = float(os.environ.get("OCR_PAGE_TIMEOUT", 30))
+WORKERS = int(os.environ.get("OCR_WORKERS", min(2, os.cpu_count() or 1)))
+LANG = os.environ.get("OCR_LANG", "eng")
+
+_pool = None
+_pool_lock = threading.Lock()
+# At most this many pages are queued or running across all uploads; pages
+# that cannot get a slot keep their (empty) pdfminer text.
+_slots = threading.BoundedSemaphore(WORKERS * 2)
+_cache = ResultCache(max_items=512, disk_dir=os.environ.get("OCR_CACHE_DIR"))
+_available = None
+
+# pdf2image, pytesseract and the tesseract/pdftoppm binaries are optional;
+# without them scanned pages are left as extracted.
+def available():
+    global _available
+    if _available is None:
+        try:
+            import pdf2image  # noqa: F401
+            import pytesseract  # noqa: F401
+        except ImportError:
+            _available = False
+        else:
+            _available = bool(shutil.which("tesseract") and shutil.which("pdftoppm"))
+        if not _available:
+            logger.info("OCR fallback disabled: pdf2image, pytesseract or tesseract/poppler not installed")
+    return _available
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=WORKERS)
+        return _pool
+
+def low_yield(text, min_chars=MIN_CHARS):
+    return len("".join(text.split())) < min_chars
+
+# ---------- Worker ----------
+def _ocr_page(args):
+    pdf_bytes, pageno, dpi, lang, timeout = args
+    from pdf2image import convert_from_bytes
+    import pytesseract
+
+    images = convert_from_bytes(pdf_bytes, dpi=dpi, first_page=pageno + 1, last_page=pageno + 1,
+                                grayscale=True, timeout=timeout)
+    if not images:
+        return ""
+    return pytesseract.image_to_string(images[0], lang=lang, timeout=timeout)
+
+# ---------- Fallback ----------
+# Rasterizes and OCRs only the low-yield pages (at most `max_pages` per
+# upload, at `dpi`), in a small shared process pool. Results are cached per
+# (document hash, page, dpi, lang). Pages that fail, time out or find no
+# free slot keep their original text. Inside a worker process (batch runs)
+# pages are OCRed inline, since that pool already bounds the CPU.
+def ocr_fallback(pdf_bytes, pages, dpi=DPI, max_pages=MAX_PAGES, timeout=PAGE_TIMEOUT, lang=LANG):
+    targets = [i for i, text in enumerate(pages) if low_yield(text)][:max_pages]
+    if not targets or not available():
+        return pages
+    doc_hash = content_hash(pdf_bytes)
+    pages = list(pages)
+    todo = []
+    for i in targets:
+        key = f"{doc_hash}:{i}:{dpi}:{lang}"
+        text = _cache.get(key)
+        if text is None:
+            todo.append((i, key))
+        elif text.strip():
+            pages[i] = text
+    if not todo:
+        return pages
+
+    jobs = {i: (bytes(pdf_bytes), i, dpi, lang, timeout) for i, _ in todo}
+    if multiprocessing.parent_process() is not None:
+        results = {}
+        for i, key in todo:
+            try:
+                results[i] = _ocr_page(jobs[i])
+            except Exception as e:
+                logger.warning("OCR failed for page %d: %s", i + 1, e)
+    else:
+        results = _run_pooled(jobs, timeout)
+    for i, key in todo:
+        if i in results:
+            _cache.set(key, results[i])
+            if results[i].strip():
+                pages[i] = results[i]
+    return pages
+
+def _run_pooled(jobs, timeout):
+    futures = {}
+    for i, job in jobs.items():
+        if not _slots.acquire(blocking=False):
+            logger.warning("OCR pool busy, skipping %d page(s)", len(jobs) - len(futures))
+            break
+        future = _get_pool().submit(_ocr_page, job)
+        future.add_done_callback(lambda _: _slots.release())
+        futures[future] = i
+    done, not_done = wait(futures, timeout=timeout * max(1, len(futures)))
+    for future in not_done:
+        future.cancel()
+    results = {}
+    for future in done:
+        try:
+            results[futures[future]] = future.result()
+        except Exception as e:
+            logger.warning("OCR failed for page %d: %s", futures[future] + 1, e)
+    return results
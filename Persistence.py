@@ -0,0 +1,102 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from Metrics import observe
+
+logger = logging.getLogger("resume_analyzer.persistence")
+
+_STOP = object()
+
+# ---------- Bulk Upserts ----------
+# Records carrying `key_field` are upserted on it, so the same resume is
+# stored once no matter how often it is analyzed; others are inserted.
+def bulk_upsert(collection, records, key_field="resume_hash"):
+    from pymongo import InsertOne, UpdateOne
+
+    ops = []
+    for record in records:
+        key = record.get(key_field)
+        if key:
+            fields = dict(record)
+            first_seen = fields.pop("first_seen", fields.get("timestamp"))
+            ops.append(UpdateOne({key_field: key},
+                                 {"$set": fields, "$setOnInsert": {"first_seen": first_seen}},
+                                 upsert=True))
+        else:
+            ops.append(InsertOne(record))
+    if ops:
+        collection.bulk_write(ops, ordered=False)
+    return len(ops)
+
+# ---------- Write-behind Queue ----------
+# Requests hand records to a bounded queue and return immediately; a
+# background thread flushes them in batches of `flush_size`, or every
+# `flush_interval` seconds, whichever comes first.
+class WriteBehindWriter:
+    def __init__(self, collection, key_field="resume_hash", max_queue=10000,
+                 flush_size=100, flush_interval=2.0, max_retries=3):
+        self.collection = collection
+        self.key_field = key_field
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.written = 0
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, record):
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("write-behind queue full, dropping record for %s", record.get(self.key_field))
+            return False
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def close(self, timeout=10.0):
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                self._flush(batch)
+                return
+            if item is not None:
+                batch.append(item)
+            if len(batch) >= self.flush_size or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        for attempt in range(self.max_retries + 1):
+            try:
+                start = time.perf_counter()
+                self.written += bulk_upsert(self.collection, batch, self.key_field)
+                observe("persist", time.perf_counter() - start)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.dropped += len(batch)
+                    logger.error("failed to persist %d records: %s", len(batch), e)
+                    return
+                time.sleep(0.5 * 2 ** attempt)
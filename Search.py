@@ -0,0 +1,203 @@
+import datetime
+import os
+import pickle
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H:%M:%S"
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOPWORDS = {
+    "a", "about", "all", "also", "an", "and", "any", "are", "as", "at", "be", "been", "but", "by", "can",
+    "do", "etc", "for", "from", "has", "have", "he", "her", "his", "i", "if", "in", "into", "is", "it",
+    "its", "me", "more", "my", "no", "not", "of", "on", "or", "our", "she", "so", "such", "than", "that",
+    "the", "their", "them", "then", "there", "these", "they", "this", "to", "too", "up", "us", "was",
+    "we", "were", "what", "when", "which", "who", "will", "with", "would", "you", "your",
+}
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+# ---------- BM25 Inverted Index ----------
+# Postings live in segments: flat NumPy arrays of (term id, row, term
+# frequency) sorted by term id, so a term's postings are one searchsorted
+# slice. New documents collect in an in-memory delta that becomes a new
+# segment once it holds `merge_every` postings or a query arrives; all
+# segments are folded into one when the index is saved. A query
+# touches only the postings of its own terms, so ranking stays in
+# milliseconds for tens of thousands of resumes. Re-adding a document
+# retires its old row.
+class SearchIndex:
+    def __init__(self, path=None, k1=1.5, b=0.75, merge_every=500000, sync_window=900):
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self.merge_every = merge_every
+        self.sync_window = sync_window
+        self.last_sync = ""
+        self._terms = {}
+        self._ids = []
+        self._rows = {}
+        self._lengths = []
+        self._alive = []
+        self._segments = []
+        self._delta = ([], [], [])
+        self._dirty = False
+        self._stats = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        index = cls(path, **kwargs)
+        if path and os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    state = pickle.load(f)
+                index.__dict__.update(state)
+            except (OSError, pickle.PickleError, EOFError):
+                pass
+        return index
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            self._flush_delta()
+            self._compact()
+            state = {k: v for k, v in self.__dict__.items() if k not in ("path", "_lock", "_stats")}
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+    def __len__(self):
+        with self._lock:
+            return len(self._rows)
+
+    def __contains__(self, doc_id):
+        with self._lock:
+            return doc_id in self._rows
+
+    def add(self, doc_id, text):
+        counts = Counter(tokenize(text))
+        with self._lock:
+            self.remove(doc_id)
+            row = len(self._ids)
+            self._ids.append(doc_id)
+            self._rows[doc_id] = row
+            self._lengths.append(sum(counts.values()))
+            self._alive.append(True)
+            terms, rows, tfs = self._delta
+            terms.extend(self._terms.setdefault(t, len(self._terms)) for t in counts)
+            rows.extend([row] * len(counts))
+            tfs.extend(counts.values())
+            self._stats = None
+            self._dirty = True
+            if len(terms) >= self.merge_every:
+                self._flush_delta()
+
+    def remove(self, doc_id):
+        with self._lock:
+            row = self._rows.pop(doc_id, None)
+            if row is not None:
+                self._alive[row] = False
+                self._stats = None
+                self._dirty = True
+
+    # Similar-sized segments are merged as they appear, so there are only
+    # ever O(log n) of them and large ones are rarely rewritten.
+    def _flush_delta(self):
+        terms, rows, tfs = self._delta
+        if not terms:
+            return
+        self._segments.append(_segment(np.array(terms, dtype=np.int32), np.array(rows, dtype=np.int32),
+                                       np.array(tfs, dtype=np.float32)))
+        self._delta = ([], [], [])
+        while len(self._segments) > 1 and len(self._segments[-2][0]) <= 4 * len(self._segments[-1][0]):
+            self._segments[-2:] = [_merge(self._segments[-2:])]
+
+    def _compact(self):
+        if len(self._segments) > 1:
+            self._segments = [_merge(self._segments)]
+
+    def _doc_stats(self):
+        if self._stats is None:
+            alive = np.array(self._alive, dtype=bool)
+            lengths = np.array(self._lengths, dtype=np.float32)
+            avgdl = float(lengths[alive].mean()) if alive.any() else 1.0
+            self._stats = alive, self.k1 * (1 - self.b + self.b * lengths / (avgdl or 1.0))
+        return self._stats
+
+    def search(self, query, k=20):
+        counts = Counter(t for t in tokenize(query) if t in self._terms)
+        with self._lock:
+            if not self._rows or not counts:
+                return []
+            self._flush_delta()
+            alive, norm = self._doc_stats()
+            term_ids = np.array([self._terms[t] for t in counts], dtype=np.int32)
+            qtf = np.array(list(counts.values()), dtype=np.float32)
+            rows, tfs, qpos = [], [], []
+            for seg_terms, seg_rows, seg_tfs in self._segments:
+                lo = np.searchsorted(seg_terms, term_ids, "left")
+                sizes = np.searchsorted(seg_terms, term_ids, "right") - lo
+                starts = np.cumsum(sizes) - sizes
+                pos = np.arange(sizes.sum()) - np.repeat(starts - lo, sizes)
+                rows.append(seg_rows[pos])
+                tfs.append(seg_tfs[pos])
+                qpos.append(np.repeat(np.arange(len(term_ids)), sizes))
+            rows, tfs, qpos = np.concatenate(rows), np.concatenate(tfs), np.concatenate(qpos)
+            live = alive[rows]
+            df = np.bincount(qpos, weights=live, minlength=len(term_ids))
+            idf = np.log(1 + (len(self._rows) - df + 0.5) / (df + 0.5))
+            weights = (qtf * idf)[qpos] * tfs * (self.k1 + 1) / (tfs + norm[rows]) * live
+            scores = np.bincount(rows, weights=weights, minlength=len(self._ids))
+            top = np.flatnonzero(scores)
+            if len(top) > k:
+                top = top[np.argpartition(-scores[top], k - 1)[:k]]
+            top = top[np.lexsort((top, -scores[top]))]
+            return [(self._ids[row], float(scores[row])) for row in top]
+
+    # Pulls analyses written since the last sync (timestamps sort as
+    # strings) and indexes those with extracted text. Returns the number
+    # of documents added. Records are stamped when queued but committed
+    # later, possibly by another process, so the query reaches back
+    # `sync_window` seconds before the newest timestamp seen; documents
+    # already indexed are skipped.
+    def sync(self, collection, batch_size=1000):
+        added = 0
+        with self._lock:
+            since = _rewind(self.last_sync, self.sync_window)
+            query = {"resume_text": {"$exists": True}, "resume_hash": {"$exists": True}}
+            if since:
+                query["timestamp"] = {"$gte": since}
+            cursor = collection.find(query, {"_id": 0, "resume_hash": 1, "resume_text": 1, "timestamp": 1},
+                                     batch_size=batch_size)
+            for doc in cursor:
+                if doc["resume_hash"] not in self._rows:
+                    self.add(doc["resume_hash"], doc.get("resume_text") or "")
+                    added += 1
+                if doc.get("timestamp", "") > self.last_sync:
+                    self.last_sync = doc["timestamp"]
+        if added or self._dirty:
+            self.save()
+        return added
+
+def _rewind(timestamp, seconds):
+    if not timestamp:
+        return timestamp
+    try:
+        moment = datetime.datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+    except ValueError:
+        return timestamp
+    return (moment - datetime.timedelta(seconds=seconds)).strftime(TIMESTAMP_FORMAT)
+
+def _segment(terms, rows, tfs):
+    order = np.argsort(terms, kind="stable")
+    return terms[order], rows[order], tfs[order]
+
+def _merge(segments):
+    return _segment(*(np.concatenate(parts) for parts in zip(*segments)))
@@ -0,0 +1,66 @@
+import json
+import os
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sections.json")
+
+# ---------- Section Rubric ----------
+# Headings, weights and level rules come from a JSON config so scoring can be
+# tuned per deployment. With "case": "exact" a heading counts only as
+# written; with "heading" its upper-case form counts too (e.g. "Experience"
+# / "EXPERIENCE"); with "any" case is ignored. Matching is by substring, so
+# "Project" also covers "Projects". Each distinct heading is at most one
+# str.find over the text, skipped once its sections are found; a section
+# keeps the offset of its first heading found. A section with weight 0
+# only feeds the level rules.
+class SectionRubric:
+    def __init__(self, config):
+        self.case = config.get("case", "heading")
+        self.sections = config["sections"]
+        self.levels = config.get("levels", [])
+        self.default_level = config.get("default_level", "Fresher")
+
+        needles = {}
+        for section, spec in self.sections.items():
+            for heading in spec["headings"]:
+                for needle in self._variants(heading):
+                    needles.setdefault(needle, []).append(section)
+        self.needles = list(needles.items())
+
+    @classmethod
+    def load(cls, path=None):
+        with open(path or DEFAULT_CONFIG, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _variants(self, heading):
+        if self.case == "any":
+            return [heading.lower()]
+        if self.case == "exact":
+            return [heading]
+        return list(dict.fromkeys([heading, heading.upper()]))
+
+    def detect(self, text):
+        if self.case == "any":
+            text = text.lower()
+        found_sections = {}
+        for needle, sections in self.needles:
+            if all(s in found_sections for s in sections):
+                continue
+            start = text.find(needle)
+            if start >= 0:
+                for section in sections:
+                    found_sections.setdefault(section, start)
+        return found_sections
+
+    def level(self, found_sections, no_of_pages=1):
+        if no_of_pages < 1:
+            return "NA"
+        for rule in self.levels:
+            if rule["section"] in found_sections:
+                return rule["level"]
+        return self.default_level
+
+    def score(self, found_sections):
+        return sum(self.sections[s].get("weight", 0) for s in found_sections)
+
+
+section_rubric = SectionRubric.load(os.environ.get("SECTIONS_CONFIG"))
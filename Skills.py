@@ -0,0 +1,78 @@
+import re
+
+# ---------- Keywords & Skills ----------
+ds_keyword = ['tensorflow','keras','pytorch','machine learning','deep learning','nlp','pandas','numpy','scikit-learn','streamlit','genai','semantic analysis']
+web_keyword = ['react', 'react.js', 'next.js','node.js', 'node js', 'express', 'express.js','mongodb', 'mongo db','javascript', 'html', 'css', 'tailwind','jwt', 'rest api', 'rest apis','prisma', 'mysql', 'socket.io']
+android_keyword = ['android','android development','flutter','kotlin','xml','kivy']
+ios_keyword = ['ios','ios development','swift','cocoa','cocoa touch','xcode']
+uiux_keyword = ['adobe xd', 'figma', 'zeplin', 'balsamiq','prototyping', 'wireframes','adobe photoshop', 'illustrator','after effects', 'indesign','user research', 'user experience']
+soft_skills = ['english','communication','writing','microsoft office','leadership','customer management','social media']
+
+FIELD_KEYWORDS = {
+    "Data Science": ds_keyword,
+    "Web Development": web_keyword,
+    "Android Development": android_keyword,
+    "IOS Development": ios_keyword,
+    "UI-UX Development": uiux_keyword,
+}
+
+all_possible_skills = ds_keyword + web_keyword + android_keyword + ios_keyword + uiux_keyword + soft_skills
+
+
+# ---------- Compiled Matcher ----------
+# One alternation regex over every keyword, tried once per word boundary.
+# The lookahead lets matches overlap (e.g. "react" inside "react.js"), and
+# longest-first ordering plus a precomputed "contained keywords" table keeps
+# the result identical to testing each keyword on its own.
+class SkillMatcher:
+    def __init__(self, field_keywords, extra_keywords=()):
+        self.skills = []
+        self.fields_of = {}
+        for field, keywords in field_keywords.items():
+            for kw in keywords:
+                self._add(kw.lower(), field)
+        for kw in extra_keywords:
+            self._add(kw.lower(), None)
+        self.fields = list(field_keywords)
+
+        ordered = sorted(self.skills, key=len, reverse=True)
+        alternation = '|'.join(re.escape(kw) for kw in ordered)
+        self.pattern = re.compile(r'\b(?=(' + alternation + r')\b)')
+
+        # A keyword contains another when the other spans two word
+        # boundaries inside it, so only those slices are looked up.
+        self.contained = {}
+        for kw in self.skills:
+            bounds = [m.start() for m in re.finditer(r'\b', kw)]
+            inner = {kw[i:j] for n, i in enumerate(bounds) for j in bounds[n + 1:]}
+            self.contained[kw] = [other for other in inner if other != kw and other in self.fields_of]
+
+    def _add(self, kw, field):
+        if kw not in self.fields_of:
+            self.skills.append(kw)
+            self.fields_of[kw] = []
+        if field is not None and field not in self.fields_of[kw]:
+            self.fields_of[kw].append(field)
+
+    def scan(self, text):
+        found = set()
+        for m in self.pattern.finditer(text.lower()):
+            kw = m.group(1)
+            if kw not in found:
+                found.add(kw)
+                found.update(self.contained[kw])
+        return [kw for kw in self.skills if kw in found]
+
+    def field_counts(self, skills):
+        counts = {field: 0 for field in self.fields}
+        for skill in skills:
+            for field in self.fields_of.get(skill.lower(), ()):
+                counts[field] += 1
+        return counts
+
+    def match(self, text):
+        skills = self.scan(text)
+        return skills, self.field_counts(skills)
+
+
+skill_matcher = SkillMatcher(FIELD_KEYWORDS, soft_skills)
@@ -0,0 +1,60 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("resume_analyzer.startup")
+
+# Seconds spent importing or loading each heavy dependency, in load order.
+timings = {}
+_lock = threading.Lock()
+_warm_thread = None
+
+@contextmanager
+def timed(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            timings[name] = timings.get(name, 0.0) + elapsed
+        logger.info("startup %s took %.3fs", name, elapsed)
+
+def timed_import(name):
+    import importlib
+    with timed("import " + name):
+        return importlib.import_module(name)
+
+# ---------- Warm-up ----------
+# Loads the parsing stack ahead of the first upload. Safe to call more than
+# once; models are cached per process by Analyzer.get_nlp().
+def warm_up(full=False):
+    with timed("import pdfminer"):
+        import pdfminer.pdfinterp, pdfminer.converter, pdfminer.layout, pdfminer.pdfpage
+    from Analyzer import get_nlp
+    with timed("load spacy ner"):
+        nlp = get_nlp()
+        list(nlp.pipe(["Jane Doe"]))
+    if full:
+        with timed("load spacy full"):
+            get_nlp(full=True)
+    return dict(timings)
+
+def warm_up_in_background(full=False):
+    global _warm_thread
+    with _lock:
+        if _warm_thread is None:
+            _warm_thread = threading.Thread(target=warm_up, args=(full,), name="warm-up", daemon=True)
+            _warm_thread.start()
+    return _warm_thread
+
+def report():
+    with _lock:
+        return dict(timings)
+
+if __name__ == "__main__":
+    # Run at image build / container start to pre-load models and print timings.
+    logging.basicConfig(level=logging.INFO)
+    for name, seconds in warm_up().items():
+        print(f"{name:<24} {seconds:.3f}s")
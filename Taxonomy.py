@@ -0,0 +1,278 @@
+import functools
+import re
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from Skills import FIELD_KEYWORDS
+
+DIM = 512
+TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+# Dots, hyphens, underscores and slashes inside a word ("node.js",
+# "scikit-learn", "ui/ux") join its parts; any other punctuation, a line
+# break or a stopword ends a phrase.
+JOINER_RE = re.compile(r"(?<=[a-z0-9+#])[._/-](?=[a-z0-9])")
+SEGMENT_TOKEN_RE = re.compile(r"[a-z0-9+#]+|[^a-z0-9+#\s]+|\n")
+STOPWORDS = {"and", "or", "the", "a", "an", "of", "in", "on", "for", "to", "with", "using", "at", "by", "as", "is", "was"}
+# Weight of the ordered word-pair feature in a phrase vector.
+BIGRAM_WEIGHT = 2.0
+BIGRAM_HASHES = 8
+CHUNK_SIZE = 2048
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower().replace("-", " ").replace("_", " ").replace(".", " "))
+
+def normalize(phrase):
+    return " ".join(tokenize(phrase))
+
+# ---------- Phrase Embeddings ----------
+# Hashed character n-grams (fastText style): spelling variants such as
+# "scikit learn" / "scikit-learn" or "machine learnings" / "machine learning"
+# land close together without any model download. A phrase is the sum of its
+# word vectors plus one feature per ordered pair of adjacent words (keyed on
+# word prefixes, so "machine learnings" keeps the pair of "machine learning"
+# while "learning machine" does not). Only distinct words and pairs are ever
+# hashed. A spaCy model with static vectors (e.g. en_core_web_md) can be
+# plugged in via SpacyEmbedder.
+class HashingEmbedder:
+    def __init__(self, dim=DIM, ngrams=(2, 3, 4), cache_size=50000):
+        self.dim = dim
+        self.ngrams = ngrams
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+
+    def _remember(self, key, vec):
+        self._cache[key] = vec
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return vec
+
+    def word(self, word):
+        vec = self._cache.get(word)
+        if vec is None:
+            vec = np.zeros(self.dim, dtype=np.float32)
+            padded = f"<{word}>"
+            for n in self.ngrams:
+                for i in range(max(1, len(padded) - n + 1)):
+                    h = zlib.crc32(padded[i:i + n].encode("utf-8"))
+                    vec[h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+            h = zlib.crc32(padded.encode("utf-8"))
+            vec[h % self.dim] += 2.0 if h & 0x80000000 else -2.0
+            vec = self._remember(word, vec)
+        return vec
+
+    def bigram(self, first, second):
+        key = f"{first[:5]} {second[:5]}"
+        vec = self._cache.get(key)
+        if vec is None:
+            vec = np.zeros(self.dim, dtype=np.float32)
+            for seed in range(BIGRAM_HASHES):
+                h = zlib.crc32(f"{key}#{seed}".encode("utf-8"))
+                vec[h % self.dim] += BIGRAM_WEIGHT if h & 0x80000000 else -BIGRAM_WEIGHT
+            vec = self._remember(key, vec)
+        return vec
+
+    # Feature table (row 0 is padding) and per-phrase feature rows: the
+    # phrase's word ids followed by the ids of its adjacent word pairs.
+    def features(self, rows, words):
+        base = len(words) + 1
+        pairs = [(rows[:, j], rows[:, j + 1]) for j in range(rows.shape[1] - 1)]
+        codes = [np.where((a > 0) & (b > 0), a * base + b, 0) for a, b in pairs]
+        unique = np.unique(np.concatenate(codes)) if codes else np.zeros(0, dtype=np.intp)
+        unique = unique[unique > 0]
+        vectors = [np.zeros(self.dim, dtype=np.float32)] + [self.word(word) for word in words]
+        vectors += [self.bigram(words[a - 1], words[b - 1]) for a, b in zip((unique // base).tolist(), (unique % base).tolist())]
+        table = np.stack(vectors)
+        columns = [rows] + [np.where(c > 0, base + np.searchsorted(unique, c), 0)[:, None] for c in codes]
+        return table, np.hstack(columns)
+
+    def _sums(self, table, feats):
+        out = table[feats[:, 0]]
+        for j in range(1, feats.shape[1]):
+            out += table[feats[:, j]]
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        return out / np.where(norms == 0, 1, norms)
+
+    def embed(self, phrases):
+        index = phrase_index([tokenize(p) for p in phrases])
+        return self._sums(*self.features(*index.arrays()))
+
+    # Cosine scores of every phrase against `matrix`. Features are hashed
+    # once per text and phrase vectors are summed in chunks, so time and
+    # memory grow linearly with the number of phrases.
+    def project(self, rows, words, matrix):
+        table, feats = self.features(rows, words)
+        out = np.zeros((len(rows), len(matrix)), dtype=np.float32)
+        for start in range(0, len(rows), CHUNK_SIZE):
+            out[start:start + CHUNK_SIZE] = self._sums(table, feats[start:start + CHUNK_SIZE]) @ matrix.T
+        return out
+
+class SpacyEmbedder:
+    def __init__(self, nlp):
+        self.nlp = nlp
+        self.dim = nlp.vocab.vectors_length
+
+    def embed(self, phrases):
+        out = np.zeros((len(phrases), self.dim), dtype=np.float32)
+        for i, doc in enumerate(self.nlp.pipe(phrases)):
+            norm = doc.vector_norm
+            if norm:
+                out[i] = doc.vector / norm
+        return out
+
+    def project(self, rows, words, matrix):
+        vocab = [""] + list(words)
+        phrases = [" ".join(vocab[i] for i in row if i) for row in rows]
+        return self.embed(phrases) @ matrix.T
+
+# ---------- Candidate Phrases ----------
+# Phrases are rows of word ids (0 = padding) into a per-text vocabulary, in
+# reading order, so duplicates collapse and each distinct word is embedded
+# once.
+class PhraseIndex:
+    def __init__(self, rows, words):
+        self.rows = rows
+        self.words = words
+
+    def __len__(self):
+        return len(self.rows)
+
+    def arrays(self):
+        return self.rows, self.words
+
+def phrase_index(phrases):
+    vocab = {}
+    rows = np.zeros((len(phrases), max((len(p) for p in phrases), default=1)), dtype=np.intp)
+    for i, words in enumerate(phrases):
+        for j, word in enumerate(words):
+            rows[i, j] = vocab.setdefault(word, len(vocab) + 1)
+    return PhraseIndex(rows, list(vocab))
+
+# Word n-grams up to the longest skill in the taxonomy, never spanning
+# punctuation, a line break or a stopword, plus noun chunks when a parsed
+# Doc is available. N-grams are deduplicated as base-(vocab size) integer
+# keys.
+def candidate_phrases(resume_text, max_n=2, doc=None):
+    vocab = {}
+    tokens = SEGMENT_TOKEN_RE.findall(JOINER_RE.sub(" ", resume_text.lower()))
+    ids = np.fromiter((vocab.setdefault(t, len(vocab) + 1) if TOKEN_RE.fullmatch(t) and t not in STOPWORDS else 0
+                       for t in tokens), dtype=np.int64)
+    chunks = set()
+    if doc is not None:
+        for chunk in doc.noun_chunks:
+            words = tokenize(chunk.text)
+            if len(words) > max_n:
+                chunks.add(tuple(vocab.setdefault(w, len(vocab) + 1) for w in words))
+    base = len(vocab) + 1
+    keys = []
+    for n in range(1, min(max_n, len(ids)) + 1):
+        window = np.lib.stride_tricks.sliding_window_view(ids, n)
+        window = window[(window > 0).all(axis=1)]
+        keys.append(window @ (base ** np.arange(n, dtype=np.int64)))
+    keys = np.unique(np.concatenate(keys)) if keys else np.zeros(0, dtype=np.int64)
+    width = max([max_n] + [len(c) for c in chunks])
+    rows = np.zeros((len(keys) + len(chunks), width), dtype=np.intp)
+    for j in range(max_n):
+        rows[:len(keys), j] = keys // base ** j % base
+    for i, chunk in enumerate(chunks, len(keys)):
+        rows[i, :len(chunk)] = chunk
+    return PhraseIndex(rows, list(vocab))
+
+# ---------- Skill Names ----------
+# Words that are not simply capitalised when a skill is shown to the user.
+DISPLAY_WORDS = {
+    "api": "API", "apis": "APIs", "css": "CSS", "genai": "GenAI", "html": "HTML", "indesign": "InDesign", "ios": "iOS",
+    "javascript": "JavaScript", "jwt": "JWT", "mongodb": "MongoDB", "mysql": "MySQL", "nlp": "NLP",
+    "numpy": "NumPy", "pytorch": "PyTorch", "rest": "REST", "socket.io": "Socket.IO",
+    "tensorflow": "TensorFlow", "xd": "XD", "xml": "XML",
+}
+
+def display_name(skill):
+    return " ".join(DISPLAY_WORDS.get(w, w[:1].upper() + w[1:]) for w in skill.split())
+
+# Skills whose word sets (plurals folded) contain one another are variants.
+def variant_key(skill):
+    return frozenset(w[:-1] if len(w) > 3 and w.endswith("s") else w for w in tokenize(skill))
+
+# ---------- Taxonomy Index ----------
+# Skills are rows of a unit-normalised matrix; each field owns a subset of
+# rows. Field scores and gaps for a resume come from one phrases x skills
+# product followed by a fields x skills membership product.
+class Taxonomy:
+    def __init__(self, field_skills, embedder=None, threshold=0.82):
+        self.embedder = embedder or HashingEmbedder()
+        self.threshold = threshold
+        self.fields = list(field_skills)
+        self.skills = []
+        positions = {}
+        for skills in field_skills.values():
+            for skill in skills:
+                if skill not in positions:
+                    positions[skill] = len(self.skills)
+                    self.skills.append(skill)
+        self.membership = np.zeros((len(self.fields), len(self.skills)), dtype=np.float32)
+        for row, skills in enumerate(field_skills.values()):
+            for skill in skills:
+                self.membership[row, positions[skill]] = 1.0
+        normalized = [normalize(s) for s in self.skills]
+        self.max_words = max((len(s.split()) for s in normalized), default=1)
+        self.matrix = self.embedder.embed(normalized)
+        self.related = (self.matrix @ self.matrix.T) >= threshold
+        centroids = self.membership @ self.matrix
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        self.centroids = centroids / np.where(norms == 0, 1, norms)
+
+    def similarities(self, phrases):
+        if not len(phrases):
+            return np.zeros((0, len(self.skills)), dtype=np.float32)
+        rows, words = phrases.arrays()
+        return self.embedder.project(rows, words, self.matrix)
+
+    def score(self, resume_text, doc=None):
+        sims = self.similarities(candidate_phrases(resume_text, self.max_words, doc))
+        best = sims.max(axis=0) if len(sims) else np.zeros(len(self.skills), dtype=np.float32)
+        hits = (best >= self.threshold).astype(np.float32)
+        field_scores = self.membership @ hits
+        return {
+            "skills": [self.skills[i] for i in np.flatnonzero(hits)],
+            "field_scores": {f: int(n) for f, n in zip(self.fields, field_scores)},
+            "best": best
+        }
+
+    # The field's most central skills that the resume lacks, leaving out
+    # spelling variants ("react.js" next to "react", "rest apis" next to
+    # "rest api") of skills already found or already picked.
+    def recommend(self, field, best, have=(), k=5):
+        row = self.fields.index(field)
+        found = best >= self.threshold
+        taken = [variant_key(s) for s in have] + [variant_key(self.skills[i]) for i in np.flatnonzero(found)]
+        candidates = np.flatnonzero(self.membership[row] * ~found * ~self.related[found].any(axis=0))
+        order = np.argsort(-(self.matrix[candidates] @ self.centroids[row]), kind="stable")
+        picked = []
+        for i in candidates[order]:
+            key = variant_key(self.skills[i])
+            if not any(key <= other or other <= key for other in taken):
+                picked.append(display_name(self.skills[i]))
+                taken.append(key)
+                if len(picked) == k:
+                    break
+        return picked
+
+    @functools.lru_cache(maxsize=4096)
+    def nearest(self, phrase, k=5):
+        words = tokenize(phrase)
+        rows = np.arange(1, len(words) + 1, dtype=np.intp).reshape(1, -1)
+        sims = self.similarities(PhraseIndex(rows if words else rows[:0], words))
+        if not len(sims):
+            return ()
+        top = np.argsort(-sims[0], kind="stable")[:k]
+        return tuple((self.skills[i], float(sims[0, i])) for i in top)
+
+_taxonomy = None
+
+def get_taxonomy():
+    global _taxonomy
+    if _taxonomy is None:
+        _taxonomy = Taxonomy(FIELD_KEYWORDS)
+    return _taxonomy
@@ -0,0 +1,130 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+CHUNK_SIZE = 1 << 20
+
+@dataclass
+class StoredUpload:
+    resume_hash: str
+    size: int
+    path: Optional[str] = None
+
+def _size(fileobj):
+    pos = fileobj.tell()
+    fileobj.seek(0, os.SEEK_END)
+    size = fileobj.tell()
+    fileobj.seek(pos)
+    return size
+
+# ---------- Content-addressed Upload Store ----------
+# Files are stored once under their SHA-256, so re-uploads and renamed copies
+# cost no extra disk. The directory is kept under `max_bytes` and `max_age`
+# seconds, evicting least recently used files first (mtime is refreshed on
+# every hit). With persist=False nothing is written and callers keep the
+# bytes in memory for the length of the analysis only.
+class UploadStore:
+    def __init__(self, root="./Uploaded_Resumes", max_bytes=500 * 1024 * 1024,
+                 max_age=7 * 24 * 3600, persist=True, chunk_size=CHUNK_SIZE):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.persist = persist
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        if persist:
+            os.makedirs(root, exist_ok=True)
+
+    def path(self, resume_hash):
+        return os.path.join(self.root, resume_hash + ".pdf")
+
+    def exists(self, resume_hash):
+        return self.persist and os.path.exists(self.path(resume_hash))
+
+    def put(self, fileobj, resume_hash=None):
+        if not self.persist:
+            if resume_hash:
+                return StoredUpload(resume_hash, _size(fileobj))
+            size, digest = self._hash_stream(fileobj)
+            return StoredUpload(digest, size)
+        if resume_hash and self.exists(resume_hash):
+            path = self.path(resume_hash)
+            os.utime(path)
+            return StoredUpload(resume_hash, os.path.getsize(path), path)
+
+        fileobj.seek(0)
+        sha = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for chunk in iter(lambda: fileobj.read(self.chunk_size), b""):
+                    sha.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            digest = sha.hexdigest()
+            path = self.path(digest)
+            if os.path.exists(path):
+                os.remove(tmp_path)
+                os.utime(path)
+            else:
+                os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        fileobj.seek(0)
+        self.evict()
+        return StoredUpload(digest, size, path)
+
+    def _hash_stream(self, fileobj):
+        fileobj.seek(0)
+        sha = hashlib.sha256()
+        size = 0
+        for chunk in iter(lambda: fileobj.read(self.chunk_size), b""):
+            sha.update(chunk)
+            size += len(chunk)
+        fileobj.seek(0)
+        return size, sha.hexdigest()
+
+    def read(self, resume_hash):
+        with open(self.path(resume_hash), "rb") as f:
+            return f.read()
+
+    def usage(self):
+        entries = self._entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def _entries(self):
+        entries = []
+        try:
+            for entry in os.scandir(self.root):
+                if entry.name.endswith(".pdf"):
+                    st = entry.stat()
+                    entries.append((entry.path, st.st_size, st.st_mtime))
+        except OSError:
+            pass
+        return entries
+
+    def evict(self):
+        if not self.persist:
+            return 0
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda e: e[2])
+            total = sum(size for _, size, _ in entries)
+            cutoff = time.time() - self.max_age if self.max_age else None
+            removed = 0
+            for path, size, mtime in entries:
+                if not ((cutoff and mtime < cutoff) or total > self.max_bytes):
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            return removed
@@ -0,0 +1,134 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+from Analyzer import (analyze, analyze_text, extract_contact, extract_name, get_nlp,
+                      predict_field, predict_level, score_resume)
+from Extractor import extract_text
+from Skills import skill_matcher
+from Taxonomy import get_taxonomy
+from benchmarks.corpus import corpus
+from benchmarks.fakes import FakeCollection, FakeGenaiClient
+
+# ---------- Measurement ----------
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return float("nan")
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+# Largest allocation growth during a single call, from tracemalloc (NumPy
+# buffers included). Run separately from the timing loop, which tracing
+# would slow down.
+def peak_alloc_mb(fn, inputs):
+    tracemalloc.start()
+    try:
+        peak = 0
+        for item in inputs:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            fn(item)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+def measure(fn, inputs, repeat=1):
+    samples = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in inputs:
+            t0 = time.perf_counter()
+            fn(item)
+            samples.append(time.perf_counter() - t0)
+    total = time.perf_counter() - start
+    return {
+        "n": len(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "per_sec": len(samples) / total if total else 0.0
+    }
+
+# ---------- Suites ----------
+# One entry per pipeline stage; each takes the prepared corpus and returns
+# (callable, inputs) so stages are timed in isolation.
+def suites(items, texts):
+    nlp = get_nlp()
+    pdfs = [data for _, _, _, data in items]
+    named = [(name, text) for (name, _, _, _), text in zip(items, texts)]
+    analyses = [analyze_text(text, name, nlp=nlp) for name, text in named]
+
+    from Gemini import GeminiClient
+    from Persistence import WriteBehindWriter
+    gemini = GeminiClient(api_key=None, client=FakeGenaiClient(latency=0.0), cache_ttl=0)
+    records = [dict(a.to_record(), resume_hash=f"h{i}") for i, a in enumerate(analyses)]
+
+    def persist(batch):
+        writer = WriteBehindWriter(FakeCollection(), flush_size=100, flush_interval=0.05)
+        for record in batch:
+            writer.submit(record)
+        writer.close()
+
+    return {
+        "extract": (extract_text, pdfs),
+        "extract_fast": (lambda pdf: extract_text(pdf, fast=True), pdfs),
+        "name": (lambda nt: extract_name(nlp, nt[1], nt[0]), named),
+        "contact": (extract_contact, texts),
+        "skills": (skill_matcher.match, texts),
+        "taxonomy": (get_taxonomy().score, texts),
+        "field": (lambda text: predict_field(skill_matcher.match(text)[1]), texts),
+        "level": (lambda text: predict_level(text, 1), texts),
+        "score": (score_resume, texts),
+        "llm_fake": (lambda text: gemini.generate(text[:2500]), texts),
+        "persist_fake": (persist, [records]),
+        "analyze": (lambda pdf: analyze(pdf, nlp=nlp), pdfs),
+    }
+
+def run(per_cell=2, page_sizes=None, repeat=1, only=None):
+    kwargs = {"page_sizes": page_sizes} if page_sizes else {}
+    items = corpus(per_cell, **kwargs)
+    texts = [extract_text(data) for _, _, _, data in items]
+    results = {}
+    for name, (fn, inputs) in suites(items, texts).items():
+        if only and name not in only:
+            continue
+        fn(inputs[0])  # warm-up
+        results[name] = measure(fn, inputs, repeat)
+        results[name]["peak_alloc_mb"] = peak_alloc_mb(fn, inputs)
+    return results
+
+def print_table(results):
+    header = f"{'stage':<14}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'per sec':>11}{'alloc MB':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        print(f"{name:<14}{r['n']:>6}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+              f"{r['per_sec']:>11.1f}{r['peak_alloc_mb']:>10.1f}")
+    print(f"peak RSS for the whole run: {peak_rss_mb():.1f} MB")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark each stage of the resume pipeline on a synthetic corpus.")
+    parser.add_argument("--per-cell", type=int, default=2, help="resumes per (pages, density) cell")
+    parser.add_argument("--pages", type=int, nargs="*", help="page sizes to generate (default 1 2 5 10 20)")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--only", nargs="*", help="stages to run")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+    results = run(args.per_cell, args.pages, args.repeat, args.only)
+    print_table(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"stages": results, "peak_rss_mb": peak_rss_mb()}, f, indent=2)
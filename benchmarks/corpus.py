@@ -0,0 +1,103 @@
+import argparse
+import os
+import random
+
+from Skills import all_possible_skills
+
+# ---------- Synthetic Resume Text ----------
+FIRST_NAMES = ["Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Meera", "Arjun", "Sara", "Kabir", "Isha"]
+LAST_NAMES = ["Sharma", "Patel", "Iyer", "Khan", "Reddy", "Gupta", "Nair", "Singh", "Das", "Mehta"]
+SECTIONS = ["Summary", "Education", "Experience", "Internships", "Skills", "Projects",
+            "Certifications", "Achievements", "Hobbies", "Interests"]
+FILLER = ("designed built shipped improved maintained analysed led collaborated delivered "
+          "reduced latency for customer facing services across teams using modern tooling and "
+          "automated testing pipelines while mentoring junior engineers").split()
+
+LINES_PER_PAGE = 52
+
+def resume_lines(rng, pages, skill_density):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [name, f"{name.split()[0].lower()}@example.com | {rng.randint(6000000000, 9999999999)}", ""]
+    total = pages * LINES_PER_PAGE
+    section = 0
+    while len(lines) < total:
+        if len(lines) % 12 == 3:
+            lines.append(SECTIONS[section % len(SECTIONS)].upper() if rng.random() < 0.5 else SECTIONS[section % len(SECTIONS)])
+            section += 1
+            continue
+        words = []
+        for _ in range(rng.randint(8, 14)):
+            if rng.random() < skill_density:
+                words.append(rng.choice(all_possible_skills))
+            else:
+                words.append(rng.choice(FILLER))
+        lines.append(" ".join(words))
+    return lines[:total]
+
+# ---------- Minimal PDF Writer ----------
+# Plain text, one Helvetica font, no external dependencies.
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def build_pdf(lines, lines_per_page=LINES_PER_PAGE):
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for page_lines in pages:
+        body = ["BT", "/F1 10 Tf", "14 TL", "50 780 Td"]
+        for line in page_lines:
+            body.append(f"({_escape(line)}) Tj T*")
+        body.append("ET")
+        stream = "\n".join(body).encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id)
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % pid for pid in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i, obj)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+def synthetic_resume(seed=0, pages=1, skill_density=0.1):
+    rng = random.Random(seed)
+    return build_pdf(resume_lines(rng, pages, skill_density))
+
+# Default grid: sizes from 1 to 20 pages at low, medium and high skill density.
+PAGE_SIZES = [1, 2, 5, 10, 20]
+DENSITIES = [0.02, 0.1, 0.3]
+
+def corpus(per_cell=3, page_sizes=PAGE_SIZES, densities=DENSITIES, seed=0):
+    items = []
+    for pages in page_sizes:
+        for density in densities:
+            for i in range(per_cell):
+                name = f"resume_p{pages:02d}_d{int(density * 100):02d}_{i}.pdf"
+                items.append((name, pages, density, synthetic_resume(seed + len(items), pages, density)))
+    return items
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic resume PDF corpus.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--per-cell", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    os.makedirs(args.out_dir, exist_ok=True)
+    for name, _, _, data in corpus(args.per_cell, seed=args.seed):
+        with open(os.path.join(args.out_dir, name), "wb") as f:
+            f.write(data)
+    print(f"Wrote {len(PAGE_SIZES) * len(DENSITIES) * args.per_cell} PDFs to {args.out_dir}")
@@ -0,0 +1,47 @@
+import time
+from types import SimpleNamespace
+
+# Local stand-ins for Gemini and MongoDB so benchmarks measure our own code,
+# not the network.
+
+class _FakeModels:
+    def __init__(self, latency, reply):
+        self.latency = latency
+        self.reply = reply
+        self.calls = 0
+
+    def generate_content(self, model, contents):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return SimpleNamespace(text=self.reply)
+
+    def generate_content_stream(self, model, contents):
+        self.calls += 1
+        for word in self.reply.split(" "):
+            if self.latency:
+                time.sleep(self.latency / 10)
+            yield SimpleNamespace(text=word + " ")
+
+class FakeGenaiClient:
+    def __init__(self, latency=0.0, reply="Seasoned engineer with strong delivery record."):
+        self.models = _FakeModels(latency, reply)
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = []
+        self.bulk_calls = 0
+
+    def bulk_write(self, ops, ordered=True):
+        self.bulk_calls += 1
+        self.docs.extend(ops)
+
+    def insert_many(self, docs, ordered=True):
+        self.bulk_calls += 1
+        self.docs.extend(docs)
+
+    def insert_one(self, doc):
+        self.docs.append(doc)
+
+    def create_index(self, *args, **kwargs):
+        return None
@@ -0,0 +1,27 @@
+import os
+import time
+
+from Cache import ResultCache
+
+
+def test_keys_with_slashes_reach_disk(tmp_path):
+    cache = ResultCache(disk_dir=str(tmp_path))
+    cache.set("abc:gap:UI/UX Designer", "answer")
+    cache.clear()
+    assert cache.get("abc:gap:UI/UX Designer") == "answer"
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(max_items=1, disk_dir=str(tmp_path), max_disk_items=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    past = time.time() - 60
+    os.utime(cache._disk_path("a"), (past, past))
+    os.utime(cache._disk_path("b"), (past + 1, past + 1))
+    cache.clear()
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    cache.clear()
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
@@ -0,0 +1,44 @@
+from Cache import content_hash
+from Dedupe import DuplicateIndex
+from Extractor import extract_text
+from benchmarks.corpus import build_pdf, synthetic_resume
+
+
+def test_blank_scans_are_not_duplicates(tmp_path):
+    index = DuplicateIndex(str(tmp_path / "near_duplicates.log"))
+    first, second = build_pdf([]), build_pdf(["", ""] * 60)
+    assert first != second
+    assert extract_text(first).strip() == extract_text(second).strip() == ""
+    assert index.canonical(content_hash(first), extract_text(first)) == content_hash(first)
+    assert index.canonical(content_hash(second), extract_text(second)) == content_hash(second)
+    assert len(index) == 0
+
+
+def test_edited_resume_maps_to_original(tmp_path):
+    index = DuplicateIndex(str(tmp_path / "near_duplicates.log"))
+    text = extract_text(synthetic_resume(seed=3))
+    assert index.canonical("a", text) == "a"
+    assert index.canonical("b", text.replace("@example.com", "@example.org")) == "a"
+
+
+def test_edited_resume_is_reparsed_but_keeps_ai_results(tmp_path):
+    import spacy
+    from Analyzer import analyze
+    from Cache import ResultCache
+    from benchmarks.corpus import build_pdf
+
+    lines = ["Rohan Mehta", "rohan@example.com | 9639700191", "Summary"] + [
+        f"delivered reporting services for team {i} across regions" for i in range(40)]
+    original, edited = build_pdf(lines), build_pdf(lines + ["Skills", "pytorch tensorflow keras"])
+    index, cache = DuplicateIndex(str(tmp_path / "near_duplicates.log")), ResultCache()
+    nlp = spacy.blank("en")
+
+    first = analyze(original, nlp=nlp, duplicates=index, reuse=cache.get)
+    first.ai_pitch = "Strong delivery record."
+    cache.set(first.resume_hash, first)
+
+    second = analyze(edited, nlp=nlp, duplicates=index, reuse=cache.get)
+    assert second.resume_hash == first.resume_hash
+    assert second.ai_pitch == "Strong delivery record."
+    assert "pytorch" in second.skills and "pytorch" not in first.skills
+    assert second.resume_score > first.resume_score
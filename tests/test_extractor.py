@@ -0,0 +1,11 @@
+from Analyzer import extract_contact
+from Extractor import extract_text
+from benchmarks.corpus import synthetic_resume
+
+
+def test_fast_mode_keeps_line_breaks():
+    pdf = synthetic_resume(seed=4, pages=2)
+    full, fast = extract_text(pdf), extract_text(pdf, fast=True)
+    assert fast.splitlines()[:2] == full.splitlines()[:2]
+    assert fast.split() == full.split()
+    assert extract_contact(fast) == extract_contact(full)
@@ -0,0 +1,14 @@
+from Analyzer import predict_level, score_resume
+
+
+def test_title_case_internship_sets_level_but_not_score():
+    assert score_resume("Internship at ACME") == 0
+    assert predict_level("Internship at ACME", 1) == "Intermediate"
+    assert score_resume("INTERNSHIPS") == 6
+
+
+def test_scores_match_original_checks():
+    assert score_resume("Summary Education EXPERIENCE Skills Projects") == 6 + 12 + 16 + 7 + 19
+    assert score_resume("summary education experience") == 0
+    assert predict_level("Work Experience", 1) == "Experienced"
+    assert predict_level("Work Experience", 0) == "NA"
@@ -0,0 +1,21 @@
+import random
+import time
+
+from Skills import SkillMatcher, skill_matcher
+
+
+def test_contained_keywords():
+    assert set(skill_matcher.contained["react.js"]) == {"react"}
+    assert set(skill_matcher.contained["android development"]) == {"android"}
+    skills, _ = skill_matcher.match("Built apps with React.js and Node.js")
+    assert {"react", "react.js", "node.js"} <= set(skills)
+
+
+def test_build_scales_to_thousands_of_keywords():
+    rng = random.Random(0)
+    words = ["".join(rng.choice("abcdefghijklmnop") for _ in range(rng.randint(3, 8))) for _ in range(2000)]
+    keywords = list(dict.fromkeys(" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(5000)))
+    start = time.perf_counter()
+    matcher = SkillMatcher({"Field": keywords})
+    assert time.perf_counter() - start < 1.0
+    assert len(matcher.skills) == len(keywords)
@@ -0,0 +1,35 @@
+from Analyzer import match_skills, predict_field
+
+
+def skills_of(text):
+    return match_skills(text, semantic=True)[0]
+
+
+def test_word_order_matters():
+    assert "machine learning" not in skills_of("Learning machine maintenance")
+
+
+def test_phrases_do_not_span_stopwords():
+    skills = skills_of("Development of Android apps")
+    assert "android development" not in skills
+    assert "ios development" not in skills
+
+
+def test_phrases_do_not_span_punctuation():
+    skills = skills_of("Skills: Node.js, Express")
+    assert "express.js" not in skills
+    assert {"node.js", "express"} <= set(skills)
+
+
+def test_spelling_variants_still_match():
+    skills = skills_of("Built machine learnings pipelines with scikit learn")
+    assert {"machine learning", "scikit-learn"} <= set(skills)
+
+
+def test_recommendations_skip_variants_of_found_skills():
+    skills, field_scores, semantic = match_skills("Skills: React, REST API, JavaScript, HTML", semantic=True)
+    field, recommended = predict_field(field_scores, semantic)
+    assert field == "Web Development"
+    lowered = {s.lower() for s in recommended}
+    assert not lowered & {"react.js", "rest apis", "react", "rest api"}
+    assert "Node.js" in recommended and "node.js" not in recommended